@@ -0,0 +1,115 @@
+"""
+Analysis Cache Module
+On-disk cache of job analyses keyed by posting content, profile, prompt and model
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+DEFAULT_CACHE_FILE = 'analysis_cache.db'
+
+
+class AnalysisCache:
+    """SQLite-backed cache of JobAnalyzer results with age and size-bounded LRU eviction"""
+
+    def __init__(self, db_file: str = DEFAULT_CACHE_FILE, max_age_days: float = 30, max_entries: int = 5000):
+        """
+        Initialize the analysis cache
+
+        Args:
+            db_file: Path to the SQLite database file
+            max_age_days: Entries older than this are treated as missing
+            max_entries: Number of entries above which the least recently
+                used ones are evicted
+        """
+        self.db_file = db_file
+        self.max_age_seconds = max_age_days * 86400
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS analysis_cache (
+                key TEXT PRIMARY KEY,
+                analysis TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_analysis_cache_accessed ON analysis_cache (accessed_at);
+        """)
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self.conn.close()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached analysis
+
+        Args:
+            key: Cache key (see JobAnalyzer.cache_key)
+
+        Returns:
+            The stored analysis dictionary, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT analysis, created_at FROM analysis_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row and now - row[1] <= self.max_age_seconds:
+                self.conn.execute("UPDATE analysis_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                self.conn.commit()
+                self.hits += 1
+                return json.loads(row[0])
+
+            if row:
+                self.conn.execute("DELETE FROM analysis_cache WHERE key = ?", (key,))
+                self.conn.commit()
+            self.misses += 1
+            return None
+
+    def put(self, key: str, analysis: Dict) -> None:
+        """
+        Store an analysis, evicting old entries if over the size cap
+
+        Args:
+            key: Cache key
+            analysis: Analysis dictionary from JobAnalyzer
+        """
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache (key, analysis, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(analysis), now, now)
+            )
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones over max_entries (caller holds the lock)"""
+        self.conn.execute("DELETE FROM analysis_cache WHERE created_at < ?", (time.time() - self.max_age_seconds,))
+
+        excess = self.conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self.conn.execute(
+                "DELETE FROM analysis_cache WHERE key IN "
+                "(SELECT key FROM analysis_cache ORDER BY accessed_at ASC LIMIT ?)", (excess,)
+            )
+            logger.debug(f"Analysis cache: evicted {excess} least recently used entries")
+
+    def log_stats(self) -> None:
+        """Log hit and miss counts"""
+        lookups = self.hits + self.misses
+        rate = (self.hits / lookups * 100) if lookups else 0
+        logger.info(f"Analysis cache: {self.hits} hits, {self.misses} misses ({rate:.0f}% hit rate)")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HTML-to-text backends of ContentExtractor
+Reports throughput, peak memory and text overlap with the readability
+backend over a corpus of saved job pages (one .html file per page)
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from content_extractor import TEXT_BACKENDS
+
+BASELINE = 'readability'
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pages')
+
+
+def load_corpus(directory: str) -> dict:
+    """Read all .html files in a directory as {file name: bytes}"""
+    pages = {}
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(('.html', '.htm')):
+            with open(os.path.join(directory, name), 'rb') as f:
+                pages[name] = f.read()
+    return pages
+
+
+def overlap(text: str, reference: str) -> float:
+    """
+    Word overlap between a text and a reference text
+
+    Returns:
+        F1 score (0-1) of the word multisets; 1.0 means the same words
+    """
+    words = Counter(text.lower().split())
+    reference_words = Counter(reference.lower().split())
+    common = sum((words & reference_words).values())
+    if not common:
+        return 1.0 if not words and not reference_words else 0.0
+    precision = common / sum(words.values())
+    recall = common / sum(reference_words.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def benchmark(backend, pages: dict, repeat: int) -> dict:
+    """Time a backend over the corpus and measure its peak traced memory"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages.values():
+            backend(page)
+    elapsed = time.perf_counter() - start
+
+    # Separate pass so tracing overhead does not skew the timing
+    peak = 0
+    texts = {}
+    tracemalloc.start()
+    for name, page in pages.items():
+        tracemalloc.reset_peak()
+        texts[name] = backend(page)[1]
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+    total_bytes = sum(len(page) for page in pages.values()) * repeat
+    return {
+        'pages_per_sec': len(pages) * repeat / elapsed,
+        'mb_per_sec': total_bytes / elapsed / (1024 * 1024),
+        'peak_kb': peak / 1024,
+        'texts': texts
+    }
+
+
+def main():
+    """Run the benchmark and print a summary table"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('corpus', nargs='?', default=DEFAULT_CORPUS,
+                        help='Directory of saved job pages (default: benchmarks/pages)')
+    parser.add_argument('--repeat', type=int, default=20, help='Passes over the corpus for timing (default: 20)')
+    parser.add_argument('--backends', nargs='+', choices=list(TEXT_BACKENDS), default=list(TEXT_BACKENDS),
+                        help='Backends to compare (default: all)')
+    parser.add_argument('--verbose', action='store_true', help='Show the overlap of every page')
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus)
+    if not pages:
+        print(f"No .html files found in {args.corpus}")
+        return 1
+
+    backends = list(dict.fromkeys([BASELINE] + args.backends))
+    print(f"Corpus: {len(pages)} pages, {sum(len(p) for p in pages.values()) / 1024:.0f} KB ({args.corpus})")
+    print(f"Timing: {args.repeat} passes; peak memory covers Python allocations only (tracemalloc)")
+    print()
+
+    results = {name: benchmark(TEXT_BACKENDS[name], pages, args.repeat) for name in backends}
+    baseline = results[BASELINE]['texts']
+
+    print(f"{'Backend':<12} {'Pages/s':>9} {'MB/s':>7} {'Peak KB':>9} {'Overlap':>8} {'Min':>6}")
+    for name in backends:
+        result = results[name]
+        scores = {page: overlap(text, baseline[page]) for page, text in result['texts'].items()}
+        print(f"{name:<12} {result['pages_per_sec']:>9.1f} {result['mb_per_sec']:>7.2f} "
+              f"{result['peak_kb']:>9.0f} {sum(scores.values()) / len(scores):>8.2f} {min(scores.values()):>6.2f}")
+        if args.verbose and name != BASELINE:
+            for page, score in scores.items():
+                print(f"  {page}: {score:.2f}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
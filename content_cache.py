@@ -0,0 +1,181 @@
+"""
+Content Cache Module
+On-disk cache of extracted page content with TTL and size-bounded LRU eviction,
+plus resolved redirect targets
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+DEFAULT_CACHE_FILE = 'content_cache.db'
+
+
+class ContentCache:
+    """SQLite-backed cache of extracted titles and text, keyed by canonical URL"""
+
+    def __init__(self, db_file: str = DEFAULT_CACHE_FILE, ttl_hours: float = 72,
+                 max_bytes: int = 50 * 1024 * 1024):
+        """
+        Initialize the content cache
+
+        Args:
+            db_file: Path to the SQLite database file
+            ttl_hours: Entries older than this are treated as missing
+            max_bytes: Total size of cached text above which the least
+                recently used entries are evicted
+        """
+        self.db_file = db_file
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS content_cache (
+                url TEXT PRIMARY KEY,
+                title TEXT,
+                content TEXT NOT NULL,
+                extra TEXT,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_content_cache_accessed ON content_cache (accessed_at);
+            CREATE TABLE IF NOT EXISTS resolved_urls (
+                url TEXT PRIMARY KEY,
+                target TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+        """)
+        # Caches created before structured fields were stored lack the column
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(content_cache)")}
+        if 'extra' not in columns:
+            self.conn.execute("ALTER TABLE content_cache ADD COLUMN extra TEXT")
+            self.conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self.conn.close()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        Look up cached content
+
+        Args:
+            url: Cache key (canonical URL, see ContentExtractor)
+
+        Returns:
+            Dictionary with 'title', 'content' and any extra fields stored
+            with them, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT title, content, extra, created_at FROM content_cache WHERE url = ?", (url,)
+            ).fetchone()
+
+            if row and now - row[3] <= self.ttl_seconds:
+                self.conn.execute("UPDATE content_cache SET accessed_at = ? WHERE url = ?", (now, url))
+                self.conn.commit()
+                self.hits += 1
+                return {**json.loads(row[2] or '{}'), 'title': row[0], 'content': row[1]}
+
+            if row:
+                self.conn.execute("DELETE FROM content_cache WHERE url = ?", (url,))
+                self.conn.commit()
+            self.misses += 1
+            return None
+
+    def put(self, url: str, title: Optional[str], content: str, extra: Optional[Dict] = None) -> None:
+        """
+        Store extracted content, evicting old entries if over the size cap
+
+        Args:
+            url: Cache key (canonical URL, see ContentExtractor)
+            title: Extracted page title
+            content: Extracted plain text
+            extra: Other JSON-serializable fields to return with the content
+                (e.g. location and salary from structured extractors)
+        """
+        extra_json = json.dumps(extra) if extra else None
+        size = len(content.encode('utf-8')) + len((title or '').encode('utf-8')) + len(extra_json or '')
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO content_cache (url, title, content, extra, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, title, content, extra_json, size, now, now)
+            )
+            self._evict()
+            self.conn.commit()
+
+    def get_redirect(self, url: str) -> Optional[str]:
+        """
+        Look up the resolved target of a redirecting URL
+
+        Args:
+            url: Redirecting URL (e.g. a link shortener)
+
+        Returns:
+            The final URL, or None if unknown or expired
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT target FROM resolved_urls WHERE url = ? AND created_at >= ?",
+                (url, time.time() - self.ttl_seconds)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put_redirect(self, url: str, target: str) -> None:
+        """
+        Store the resolved target of a redirecting URL
+
+        Args:
+            url: Redirecting URL
+            target: Final URL it redirects to
+        """
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO resolved_urls (url, target, created_at) VALUES (?, ?, ?)",
+                (url, target, time.time())
+            )
+            self.conn.commit()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones over max_bytes (caller holds the lock)"""
+        self.conn.execute("DELETE FROM content_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        self.conn.execute("DELETE FROM resolved_urls WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM content_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for url, size in self.conn.execute(
+            "SELECT url, size FROM content_cache ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM content_cache WHERE url = ?", (url,))
+            total -= size
+            evicted += 1
+
+        logger.debug(f"Content cache: evicted {evicted} least recently used entries")
+
+    def log_stats(self) -> None:
+        """Log hit and miss counts"""
+        lookups = self.hits + self.misses
+        rate = (self.hits / lookups * 100) if lookups else 0
+        logger.info(f"Content cache: {self.hits} hits, {self.misses} misses ({rate:.0f}% hit rate)")
@@ -0,0 +1,131 @@
+"""
+Content Condenser Module
+Shrinks extracted job text to a token budget, keeping the sections that
+matter for matching (requirements, responsibilities) over company boilerplate
+"""
+
+import re
+from typing import List, Tuple
+
+# Rough size of a token in characters, for turning a token budget into text length
+CHARS_PER_TOKEN = 4
+
+# Section kinds in the order they are kept when the budget is short
+SECTION_PRIORITY = ('requirements', 'responsibilities', 'intro', 'other', 'benefits', 'about')
+
+# Heading patterns per section kind, checked in order ("About the role" is
+# about responsibilities, not about the company)
+_SECTION_PATTERNS = [
+    ('requirements', re.compile(
+        r'requirement|qualification|must.have|nice.to.have|preferred|skills|experience|'
+        r'what you.{0,6}(need|bring|have)|who you are|about you|you have|you should|looking for|ideal candidate',
+        re.IGNORECASE)),
+    ('responsibilities', re.compile(
+        r'responsibilit|dut(y|ies)|what you.{0,6}(do|work on|be doing)|about the (role|job|position)|'
+        r'the (role|job|position)|your (role|impact|day)|day.to.day|role overview|job description|tasks',
+        re.IGNORECASE)),
+    ('benefits', re.compile(
+        r'benefit|perks|we offer|compensation|salary|pay range|what.{0,6}(get|offer)|why (join|work)',
+        re.IGNORECASE)),
+    ('about', re.compile(
+        r'\babout\b|who we are|our (mission|story|values|culture|company)|'
+        r'company|culture|equal (opportunity|employment)|diversity|eeo|privacy',
+        re.IGNORECASE)),
+]
+
+# Longest line still treated as a heading; lines without a trailing ':' must
+# be shorter, so a bullet like "Experience with Docker and AWS" stays body text
+_MAX_HEADING_CHARS = 60
+_MAX_HEADING_WORDS = 8
+_MAX_BARE_HEADING_WORDS = 4
+
+
+def _heading_kind(line: str) -> str:
+    """
+    Classify a line as a section heading
+
+    Returns:
+        Section kind, 'other' for an unrecognized heading ending in ':', or
+        '' if the line is not a heading
+    """
+    text = line.strip().strip('#*-•').strip()
+    if not text or len(text) > _MAX_HEADING_CHARS or len(text.split()) > _MAX_HEADING_WORDS:
+        return ''
+    # Sentences are not headings
+    if text.endswith(('.', ',', ';')) or text[0].islower():
+        return ''
+    if not text.endswith(':') and len(text.split()) > _MAX_BARE_HEADING_WORDS:
+        return ''
+    for kind, pattern in _SECTION_PATTERNS:
+        if pattern.search(text):
+            return kind
+    return 'other' if text.endswith(':') else ''
+
+
+def split_sections(text: str) -> List[Tuple[str, List[str]]]:
+    """
+    Split extracted text into sections at recognized headings
+
+    Args:
+        text: Newline-separated text from ContentExtractor
+
+    Returns:
+        List of (kind, lines) in document order; text before the first
+        heading is an 'intro' section
+    """
+    sections = [('intro', [])]
+    for line in text.split('\n'):
+        if not line.strip():
+            continue
+        kind = _heading_kind(line)
+        if kind:
+            sections.append((kind, [line]))
+        else:
+            sections[-1][1].append(line)
+    return [(kind, lines) for kind, lines in sections if lines]
+
+
+def condense(text: str, token_budget: int) -> str:
+    """
+    Condense job text to roughly a token budget
+
+    Sections are filled in order of SECTION_PRIORITY until the budget runs
+    out; a line that no longer fits is cut at the remaining budget. Kept
+    sections stay in document order. Text without recognizable sections
+    is simply truncated.
+
+    Args:
+        text: Extracted job text
+        token_budget: Maximum tokens (estimated as CHARS_PER_TOKEN characters each)
+
+    Returns:
+        Condensed text
+    """
+    budget = max(0, token_budget) * CHARS_PER_TOKEN
+    if len(text) <= budget:
+        return text
+
+    sections = split_sections(text)
+    if len(sections) < 2:
+        return text[:budget]
+
+    order = sorted(range(len(sections)), key=lambda i: SECTION_PRIORITY.index(sections[i][0]))
+    kept = {}
+    remaining = budget
+    for i in order:
+        kind, lines = sections[i]
+        partial = []
+        used = 0
+        for line in lines:
+            if remaining - used <= 1:
+                break
+            piece = line[:remaining - used - 1]
+            partial.append(piece)
+            used += len(piece) + 1
+        # A heading on its own carries nothing; give its space to the next section
+        if len(partial) > (0 if kind == 'intro' else 1):
+            kept[i] = partial
+            remaining -= used
+
+    condensed = '\n'.join(line for i in sorted(kept) for line in kept[i])
+    return condensed or text[:budget]
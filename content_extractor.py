@@ -1,71 +1,889 @@
 """
 Content Extractor Module
-Uses readability-lxml to extract clean content from job posting pages
+Uses readability-lxml to extract clean content from job posting pages, with
+structured fast paths for known applicant tracking systems
 """
 
+import hashlib
+import html
+import json
+import queue
+import re
+import threading
+import time
+import lxml.etree
+import lxml.html
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from collections import deque
 from readability import Document
-from typing import Optional
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
 from bs4 import BeautifulSoup
+from content_cache import ContentCache, DEFAULT_CACHE_FILE
+from rate_limiter import HostRateLimiter, RateLimited, parse_retry_after, process_pool
+from url_utils import canonicalize_url, needs_resolution, unwrap_redirect
 from logger import get_logger
 
 logger = get_logger(__name__)
 
 
+# Throttle applied after a 429/503 response without a Retry-After header (seconds)
+DEFAULT_RETRY_AFTER = 30
+
+# Content types handed to the HTML parsers as-is
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+# Content types servers use for anything; the body is sniffed instead
+GENERIC_CONTENT_TYPES = ('', 'text/plain', 'application/octet-stream', 'binary/octet-stream')
+
+# Leading bytes of common non-HTML formats
+_BINARY_SIGNATURES = (
+    (b'%PDF', 'a PDF document'),
+    (b'PK\x03\x04', 'a ZIP archive (e.g. DOCX)'),
+    (b'\xd0\xcf\x11\xe0', 'an Office document'),
+    (b'\x89PNG', 'a PNG image'),
+    (b'\xff\xd8\xff', 'a JPEG image'),
+    (b'GIF8', 'a GIF image'),
+    (b'\x1aE\xdf\xa3', 'a WebM/Matroska video'),
+    (b'ID3', 'an MP3 file'),
+    (b'OggS', 'an Ogg media file'),
+    (b'RIFF', 'a RIFF media file'),
+)
+
+
+class PageSkipped(Exception):
+    """Raised when a page is not extracted because of its type or size"""
+
+
+def sniff_content(head: bytes, content_type: str = '') -> Optional[str]:
+    """
+    Check the first bytes of a response body for non-HTML content
+    
+    Args:
+        head: First bytes of the body
+        content_type: Declared media type (lower-case, without parameters)
+        
+    Returns:
+        Description of the detected non-HTML content, or None if the body
+        can be parsed as HTML
+    """
+    start = head.lstrip()
+    for signature, description in _BINARY_SIGNATURES:
+        if start.startswith(signature):
+            return description
+    if head[4:8] == b'ftyp':
+        return 'an MP4/QuickTime video'
+    if b'\x00' in head[:1024]:
+        return 'binary data'
+    
+    # Generic types are only accepted when the body actually looks like markup
+    if content_type in GENERIC_CONTENT_TYPES:
+        sample = head[:2048].lower()
+        if not any(tag in sample for tag in (b'<!doctype html', b'<html', b'<head', b'<body')):
+            return f"non-HTML {content_type or 'untyped'} content"
+    return None
+
+
+# Lines that change between fetches of an unchanged posting
+_VOLATILE_LINE_RE = re.compile(
+    r'^(posted|updated|reposted|published|active)\b.*\bago$'
+    r'|^\d+\+?\s+(minutes?|hours?|days?|weeks?|months?)\s+ago$'
+    r'|^(over\s+)?\d[\d,]*\+?\s+(applicants?|applications?|views?|clicks?)\b'
+    r'|^(apply|apply now|easy apply|share|share this job|save|save job|report this job|sign in|log in)$'
+    r'|\b(we|this site|this website) uses? cookies\b|\bcookie (policy|settings|preferences)\b',
+    re.IGNORECASE
+)
+_WORD_RE = re.compile(r'\w+')
+
+
+def content_fingerprint(text: str) -> str:
+    """
+    Stable fingerprint of extracted posting text
+    
+    Lines that change without the posting changing (relative post dates,
+    applicant counts, apply/share buttons, cookie notices) are dropped and
+    the remaining words are lower-cased, so the fingerprint only changes
+    when the wording of the posting does.
+    
+    Args:
+        text: Extracted plain text
+        
+    Returns:
+        Hex digest of the normalized text
+    """
+    words = []
+    for line in (text or '').split('\n'):
+        line = line.strip()
+        if line and not _VOLATILE_LINE_RE.search(line):
+            words.extend(_WORD_RE.findall(line.lower()))
+    return hashlib.blake2b(' '.join(words).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def html_to_text(page: bytes) -> tuple:
+    """
+    Extract the main content of a page as plain text
+    
+    Module-level so it can run in a worker process.
+    
+    Args:
+        page: Raw page bytes
+        
+    Returns:
+        Tuple of (title, text content)
+    """
+    # Use readability to extract main content
+    doc = Document(page)
+    
+    # Get clean HTML
+    clean_html = doc.summary()
+    
+    # Convert to plain text
+    soup = BeautifulSoup(clean_html, 'lxml')
+    text_content = soup.get_text(separator='\n', strip=True)
+    
+    # Clean up extra whitespace
+    text_content = '\n'.join(line.strip() for line in text_content.split('\n') if line.strip())
+    
+    return doc.title(), text_content
+
+
+# Elements whose text is never part of a posting
+_SKIP_TAGS = frozenset({
+    'head', 'script', 'style', 'noscript', 'template', 'svg', 'iframe', 'form', 'button', 'select'
+})
+# Page chrome dropped by the readability-free backends
+_BOILERPLATE_TAGS = frozenset({'nav', 'header', 'footer', 'aside'})
+_BOILERPLATE_RE = re.compile(
+    r'(^|[\s_-])(nav|navbar|menu|footer|sidebar|cookies?|banner|breadcrumbs?|share|social|'
+    r'related|subscribe|newsletter|modal|popup)([\s_-]|$)',
+    re.IGNORECASE
+)
+# Elements that start a new line of text
+_BLOCK_TAGS = frozenset({
+    'address', 'article', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'figcaption', 'figure',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'li', 'main', 'ol', 'p', 'pre', 'section',
+    'table', 'td', 'th', 'tr', 'ul'
+})
+# Elements whose text counts towards the score of their container
+_CONTENT_TAGS = ('p', 'li', 'pre', 'td', 'dd', 'blockquote')
+
+
+_parsers = threading.local()
+
+
+def _text_parser() -> lxml.html.HTMLParser:
+    """
+    HTML parser for the text backends, one per thread (lxml parsers are not thread-safe)
+
+    iterwalk never yields comments or processing instructions, so the text
+    after one (e.g. CMS markers like <!-- wp:list -->) would be lost; the
+    parser drops them instead, which keeps that text.
+    """
+    parser = getattr(_parsers, 'html', None)
+    if parser is None:
+        parser = _parsers.html = lxml.html.HTMLParser(remove_comments=True, remove_pis=True)
+    return parser
+
+
+def _is_boilerplate(element) -> bool:
+    """Check whether an element is navigation, footer or similar page chrome"""
+    if element.tag in _BOILERPLATE_TAGS:
+        return True
+    attrs = f"{element.get('class', '')} {element.get('id', '')}".strip()
+    return bool(attrs) and bool(_BOILERPLATE_RE.search(attrs))
+
+
+def _tree_text(roots: Iterable) -> str:
+    """Plain text of element trees in a single walk, one line per block element"""
+    parts = []
+    for root in roots:
+        walker = lxml.etree.iterwalk(root, events=('start', 'end'))
+        for event, element in walker:
+            tag = element.tag if isinstance(element.tag, str) else None
+            if event == 'start':
+                if tag is None or tag in _SKIP_TAGS or (element is not root and _is_boilerplate(element)):
+                    walker.skip_subtree()
+                    continue
+                if tag in _BLOCK_TAGS:
+                    parts.append('\n')
+                if element.text:
+                    parts.append(element.text)
+            else:
+                if tag in _BLOCK_TAGS:
+                    parts.append('\n')
+                if element is not root and element.tail:
+                    parts.append(element.tail)
+        parts.append('\n')
+    
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def _page_title(doc) -> str:
+    """Text of a document's <title>"""
+    return ' '.join((doc.findtext('.//title') or '').split())
+
+
+def lxml_to_text(page: bytes) -> tuple:
+    """
+    Convert a whole page to plain text with one lxml parse and tree walk
+    
+    Scripts, forms and page chrome (nav, header, footer, sidebars) are
+    dropped, but unlike the readability backend no main-content detection
+    is done.
+    
+    Args:
+        page: Raw page bytes
+        
+    Returns:
+        Tuple of (title, text content)
+    """
+    doc = lxml.html.document_fromstring(page, parser=_text_parser())
+    body = doc.find('body')
+    return _page_title(doc), _tree_text([body if body is not None else doc])
+
+
+def heuristic_to_text(page: bytes) -> tuple:
+    """
+    Extract the main content of a page without readability
+    
+    Paragraph-like elements add their text length to their parent and half
+    of it to their grandparent; the container with the highest score,
+    discounted by its link density, is taken as the main content together
+    with sibling containers scoring at least a fifth of it.
+    
+    Args:
+        page: Raw page bytes
+        
+    Returns:
+        Tuple of (title, text content)
+    """
+    doc = lxml.html.document_fromstring(page, parser=_text_parser())
+    body = doc.find('body')
+    if body is None:
+        body = doc
+    
+    scores: Dict = {}
+    for element in body.iter(*_CONTENT_TAGS):
+        if any(a.tag in _SKIP_TAGS or _is_boilerplate(a) for a in element.iterancestors()):
+            continue
+        length = len(' '.join(element.text_content().split()))
+        if length < 25:
+            continue
+        parent = element.getparent()
+        scores[parent] = scores.get(parent, 0) + length
+        grandparent = parent.getparent()
+        if grandparent is not None:
+            scores[grandparent] = scores.get(grandparent, 0) + length / 2
+    
+    if not scores:
+        return _page_title(doc), _tree_text([body])
+    
+    for candidate in scores:
+        text_length = len(candidate.text_content()) or 1
+        link_length = sum(len(a.text_content()) for a in candidate.iter('a'))
+        scores[candidate] *= 1 - min(1.0, link_length / text_length)
+    
+    best = max(scores, key=scores.get)
+    parent = best.getparent()
+    if parent is None:
+        return _page_title(doc), _tree_text([best])
+    
+    threshold = scores[best] * 0.2
+    selected = [
+        sibling for sibling in parent
+        if sibling is best or (sibling in scores and scores[sibling] >= threshold)
+    ]
+    return _page_title(doc), _tree_text(selected)
+
+
+# HTML-to-text backends selectable with the ``text_backend`` setting
+TEXT_BACKENDS: Dict[str, Callable[[bytes], tuple]] = {
+    'readability': html_to_text,
+    'lxml': lxml_to_text,
+    'heuristic': heuristic_to_text,
+}
+
+
+# Structured extractors for known applicant tracking systems, tried before
+# the generic readability path. Each entry is (host regex, function); the
+# function is called as fn(extractor, url, fetch_page) where fetch_page()
+# returns the page bytes (fetched at most once), and returns a result dict
+# or None to fall back to readability.
+STRUCTURED_EXTRACTORS: List[Tuple[Pattern, Callable]] = []
+
+
+def register_extractor(host_pattern: str) -> Callable:
+    """
+    Register a structured extractor for hosts matching a regex
+    
+    Args:
+        host_pattern: Regular expression matched against the URL host
+        
+    Returns:
+        Decorator that registers the function and returns it unchanged
+    """
+    def decorator(func: Callable) -> Callable:
+        STRUCTURED_EXTRACTORS.append((re.compile(host_pattern, re.IGNORECASE), func))
+        return func
+    return decorator
+
+
+def find_structured_extractor(url: str) -> Optional[Callable]:
+    """
+    Find the registered structured extractor for a URL's host
+    
+    Args:
+        url: Job posting URL
+        
+    Returns:
+        The extractor function, or None if no pattern matches
+    """
+    host = urlsplit(url).hostname or ''
+    for pattern, func in STRUCTURED_EXTRACTORS:
+        if pattern.search(host):
+            return func
+    return None
+
+
+def html_fragment_to_text(html_fragment: str) -> str:
+    """Convert an HTML description fragment into cleaned plain text"""
+    text = BeautifulSoup(html_fragment or '', 'lxml').get_text(separator='\n', strip=True)
+    return '\n'.join(line.strip() for line in text.split('\n') if line.strip())
+
+
+def build_structured_result(url: str, source: str, title: str, description: str,
+                            location: Optional[str] = None, salary: Optional[str] = None) -> dict:
+    """
+    Build an extraction result from structured posting fields
+    
+    Location and salary are also prepended to the content so they reach
+    the analysis prompt (and the content cache).
+    
+    Args:
+        url: Job posting URL
+        source: Name of the structured extractor
+        title: Job title
+        description: Plain-text description
+        location: Optional location
+        salary: Optional salary range
+        
+    Returns:
+        Dictionary with title, content, url, location, salary and source
+    """
+    header = []
+    if location:
+        header.append(f"Location: {location}")
+    if salary:
+        header.append(f"Salary: {salary}")
+    content = '\n'.join(header + [description]) if header else description
+    
+    return {
+        'title': title,
+        'content': content,
+        'url': url,
+        'location': location,
+        'salary': salary,
+        'source': source
+    }
+
+
+def _format_salary(currency: Optional[str], minimum, maximum, unit: Optional[str] = None) -> Optional[str]:
+    """Format a salary range such as 'USD 100000-150000 per YEAR'"""
+    if minimum is None and maximum is None:
+        return None
+    amount = '-'.join(str(v) for v in (minimum, maximum) if v is not None)
+    text = f"{currency} {amount}" if currency else amount
+    return f"{text} per {unit}" if unit else text
+
+
+@register_extractor(r'^(job-)?boards(\.eu)?\.greenhouse\.io$')
+def extract_greenhouse(extractor, url: str, fetch_page: Callable) -> Optional[dict]:
+    """Greenhouse job boards: use the public Job Board API"""
+    match = re.match(r'^/(?P<board>[^/]+)/jobs/(?P<job_id>\d+)', urlsplit(url).path)
+    if not match:
+        return None
+    
+    api_host = 'boards-api.eu.greenhouse.io' if '.eu.' in urlsplit(url).hostname else 'boards-api.greenhouse.io'
+    api_url = f"https://{api_host}/v1/boards/{match['board']}/jobs/{match['job_id']}?pay_transparency=true"
+    data = extractor._fetch(api_url).json()
+    
+    salary = None
+    for pay in data.get('pay_input_ranges') or []:
+        salary = _format_salary(
+            pay.get('currency_type'),
+            pay['min_cents'] // 100 if pay.get('min_cents') is not None else None,
+            pay['max_cents'] // 100 if pay.get('max_cents') is not None else None
+        )
+        break
+    
+    return build_structured_result(
+        url, 'greenhouse',
+        title=data.get('title', ''),
+        description=html_fragment_to_text(html.unescape(data.get('content', ''))),
+        location=(data.get('location') or {}).get('name'),
+        salary=salary
+    )
+
+
+@register_extractor(r'^jobs(\.eu)?\.lever\.co$')
+def extract_lever(extractor, url: str, fetch_page: Callable) -> Optional[dict]:
+    """Lever job pages: use the public Postings API"""
+    match = re.match(r'^/(?P<company>[^/]+)/(?P<posting_id>[0-9a-fA-F-]{36})', urlsplit(url).path)
+    if not match:
+        return None
+    
+    api_host = 'api.eu.lever.co' if '.eu.' in urlsplit(url).hostname else 'api.lever.co'
+    data = extractor._fetch(f"https://{api_host}/v0/postings/{match['company']}/{match['posting_id']}").json()
+    
+    sections = [data.get('descriptionPlain', '')]
+    for item in data.get('lists') or []:
+        sections.append(item.get('text', ''))
+        sections.append(html_fragment_to_text(item.get('content', '')))
+    sections.append(data.get('additionalPlain', ''))
+    description = '\n'.join(line.strip() for s in sections for line in (s or '').split('\n') if line.strip())
+    
+    pay = data.get('salaryRange') or {}
+    # Lever intervals look like 'per-year-salary'
+    interval = (pay.get('interval') or '').split('-')
+    unit = interval[1].upper() if len(interval) > 1 else None
+    return build_structured_result(
+        url, 'lever',
+        title=data.get('text', ''),
+        description=description,
+        location=(data.get('categories') or {}).get('location'),
+        salary=_format_salary(pay.get('currency'), pay.get('min'), pay.get('max'), unit)
+    )
+
+
+def _find_job_posting(data) -> Optional[dict]:
+    """Find a schema.org JobPosting object in parsed JSON-LD"""
+    if isinstance(data, list):
+        for item in data:
+            found = _find_job_posting(item)
+            if found:
+                return found
+    elif isinstance(data, dict):
+        types = data.get('@type')
+        if types == 'JobPosting' or (isinstance(types, list) and 'JobPosting' in types):
+            return data
+        if '@graph' in data:
+            return _find_job_posting(data['@graph'])
+    return None
+
+
+def _json_ld_location(posting: dict) -> Optional[str]:
+    """Format the jobLocation of a JobPosting"""
+    locations = posting.get('jobLocation') or []
+    if isinstance(locations, dict):
+        locations = [locations]
+    
+    names = []
+    for location in locations:
+        address = location.get('address', {}) if isinstance(location, dict) else {}
+        if isinstance(address, str):
+            names.append(address)
+            continue
+        parts = [address.get(k) for k in ('addressLocality', 'addressRegion', 'addressCountry')]
+        parts = [p.get('name') if isinstance(p, dict) else p for p in parts]
+        if any(parts):
+            names.append(', '.join(p for p in parts if p))
+    
+    if posting.get('jobLocationType') == 'TELECOMMUTE':
+        names.append('Remote')
+    return '; '.join(names) or None
+
+
+def _json_ld_salary(posting: dict) -> Optional[str]:
+    """Format the baseSalary of a JobPosting"""
+    salary = posting.get('baseSalary')
+    if not isinstance(salary, dict):
+        return None
+    value = salary.get('value')
+    if isinstance(value, dict):
+        return _format_salary(
+            salary.get('currency'),
+            value.get('minValue', value.get('value')),
+            value.get('maxValue'),
+            value.get('unitText')
+        )
+    return _format_salary(salary.get('currency'), value, None)
+
+
+@register_extractor(r'^jobs\.ashbyhq\.com$')
+@register_extractor(r'\.myworkdayjobs\.com$')
+@register_extractor(r'^(jobs|careers)\.smartrecruiters\.com$')
+def extract_json_ld(extractor, url: str, fetch_page: Callable) -> Optional[dict]:
+    """Pages embedding a schema.org JobPosting as JSON-LD"""
+    tree = lxml.html.fromstring(fetch_page())
+    for script in tree.xpath('//script[@type="application/ld+json"]'):
+        try:
+            posting = _find_job_posting(json.loads(script.text_content()))
+        except ValueError:
+            continue
+        if not posting:
+            continue
+        
+        return build_structured_result(
+            url, 'json-ld',
+            title=html.unescape(posting.get('title', '')),
+            description=html_fragment_to_text(html.unescape(posting.get('description', ''))),
+            location=_json_ld_location(posting),
+            salary=_json_ld_salary(posting)
+        )
+    return None
+
+
 class ContentExtractor:
     """Extract clean content from web pages using readability"""
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, settings: Optional[Dict] = None):
         """
         Initialize content extractor
         
         Args:
             timeout: Request timeout in seconds
+            settings: Optional ``settings`` block from user_profile.json
         """
         self.timeout = timeout
+        self.settings = settings or {}
+        # Pages fetched in parallel, overall and per host
+        self.max_workers = max(1, int(self.settings.get('max_concurrent_extractions', 1)))
+        self.max_per_host = max(1, int(self.settings.get('max_extractions_per_host', 2)))
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9'
         }
+        self.session = self._create_session()
+        # Requests are paced per host; 429/503 responses pause the host for its Retry-After
+        self.rate_limiter = HostRateLimiter(self.settings)
+        self.rate_limit_retries = int(self.settings.get('rate_limit_retries', 2))
+        self.max_retry_after = float(self.settings.get('max_retry_after_seconds', 300))
+        # Redirecting URL -> final URL, for links that had to be followed with HEAD
+        self._resolved: Dict[str, str] = {}
+        self._resolved_lock = threading.Lock()
+        # Pages larger than this are skipped without reading the rest of the body
+        self.max_page_bytes = int(self.settings.get('max_page_bytes', 2 * 1024 * 1024))
+        # URL -> reason for pages skipped because of their content type or size
+        self.skipped: Dict[str, str] = {}
+        self._skipped_lock = threading.Lock()
+        
+        # Extracted title/text is cached on disk, keyed by text backend and canonical URL
+        self.cache = None
+        if self.settings.get('content_cache', False):
+            self.cache = ContentCache(
+                self.settings.get('content_cache_file', DEFAULT_CACHE_FILE),
+                ttl_hours=float(self.settings.get('content_cache_ttl_hours', 72)),
+                max_bytes=int(float(self.settings.get('content_cache_max_mb', 50)) * 1024 * 1024)
+            )
+        
+        backend = self.settings.get('text_backend', 'readability')
+        if backend not in TEXT_BACKENDS:
+            raise ValueError(f"Unknown text_backend '{backend}' (expected one of: {', '.join(TEXT_BACKENDS)})")
+        self.text_backend = backend
+        self.to_text = TEXT_BACKENDS[backend]
+        
+        # Readability parsing is CPU-bound and holds the GIL; optionally run it in worker processes
+        self.parse_processes = int(self.settings.get('parse_processes', 0))
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+    
+    def _create_session(self) -> requests.Session:
+        """
+        Create the pooled HTTP session shared by all page fetches
+        
+        Connections are kept alive and reused per host, and idempotent
+        requests are retried with exponential backoff on connection errors
+        and transient 5xx responses. 503 is left to _get, which pauses the
+        host for its Retry-After instead of retrying straight away.
+        
+        Returns:
+            Configured requests Session
+        """
+        retry = Retry(
+            total=int(self.settings.get('http_retries', 3)),
+            backoff_factor=float(self.settings.get('http_retry_backoff', 0.5)),
+            status_forcelist=(500, 502, 504),
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+            raise_on_status=False,
+            # Retry-After is handled by the host rate limiter instead of sleeping here
+            respect_retry_after_header=False
+        )
+        pool_size = int(self.settings.get('http_pool_size', max(10, self.max_workers)))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def close(self) -> None:
+        """Close the pooled HTTP session, the parse pool and the content cache"""
+        self.session.close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
+        if self.cache:
+            self.cache.close()
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET a URL through the pooled session once its host's rate limit allows
+        
+        Args:
+            url: URL to fetch
+            **kwargs: Extra arguments for Session.get
+            
+        Returns:
+            Response (not checked for HTTP error status)
+            
+        Raises:
+            RateLimited: On 429 or 503; the host is throttled first
+            requests.exceptions.RequestException: On network errors
+        """
+        self.rate_limiter.acquire(urlsplit(url).hostname or '')
+        response = self.session.get(url, timeout=self.timeout, **kwargs)
+        
+        if response.status_code in (429, 503):
+            delay = parse_retry_after(response.headers.get('Retry-After'))
+            if delay is None:
+                delay = DEFAULT_RETRY_AFTER
+            # Redirects may have ended on another host; throttle the one that answered
+            host = urlsplit(response.url).hostname or ''
+            response.close()
+            self.rate_limiter.throttle(host, delay)
+            raise RateLimited(host, delay)
+        return response
+    
+    def _fetch(self, url: str) -> requests.Response:
+        """
+        GET a URL through the pooled session
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            Successful response
+            
+        Raises:
+            RateLimited: If the server asks us to slow down
+            requests.exceptions.RequestException: On network errors or HTTP error status
+        """
+        response = self._get(url)
+        response.raise_for_status()
+        return response
+    
+    def _download_page(self, url: str) -> bytes:
+        """
+        Stream an HTML page, rejecting other content types and oversized bodies
+        
+        The declared Content-Type and Content-Length are checked before the
+        body is read, the first chunk is sniffed for binary formats, and
+        reading stops as soon as max_page_bytes is exceeded.
+        
+        Args:
+            url: Page URL
+            
+        Returns:
+            Page bytes
+            
+        Raises:
+            PageSkipped: If the page is not HTML or is too large
+            RateLimited: If the server asks us to slow down
+            requests.exceptions.RequestException: On network errors or HTTP error status
+        """
+        with self._get(url, stream=True) as response:
+            response.raise_for_status()
+            
+            content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+            if content_type not in HTML_CONTENT_TYPES + GENERIC_CONTENT_TYPES:
+                raise PageSkipped(f"unsupported content type {content_type}")
+            
+            length = response.headers.get('Content-Length', '')
+            if length.isdigit() and int(length) > self.max_page_bytes:
+                raise PageSkipped(f"Content-Length {length} exceeds the {self.max_page_bytes} byte limit")
+            
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                if not chunks:
+                    detected = sniff_content(chunk, content_type)
+                    if detected:
+                        raise PageSkipped(f"body is {detected}")
+                size += len(chunk)
+                if size > self.max_page_bytes:
+                    raise PageSkipped(f"page exceeds the {self.max_page_bytes} byte limit")
+                chunks.append(chunk)
+            return b''.join(chunks)
+    
+    def resolve_url(self, url: str) -> str:
+        """
+        Find the URL a link finally points to, so the page is fetched directly
+        
+        Redirect wrappers such as Google Alerts links are decoded locally.
+        Only link shorteners and wrappers that cannot be decoded are followed
+        with a HEAD request. Those results are cached in memory and, when the
+        content cache is enabled, on disk.
+        
+        Args:
+            url: Job link
+            
+        Returns:
+            Final URL (the decoded or input URL if it cannot be resolved)
+        """
+        target = unwrap_redirect(url)
+        if not needs_resolution(target):
+            return target
+        
+        with self._resolved_lock:
+            resolved = self._resolved.get(target)
+        if resolved is None and self.cache:
+            resolved = self.cache.get_redirect(target)
+        if resolved is not None:
+            return resolved
+        
+        try:
+            self.rate_limiter.acquire(urlsplit(target).hostname or '')
+            response = self.session.head(target, allow_redirects=True, timeout=self.timeout)
+            response.close()
+            resolved = unwrap_redirect(response.url)
+            logger.debug(f"Resolved {target} -> {resolved}")
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Could not resolve redirect {target}: {str(e)}")
+            return target
+        
+        with self._resolved_lock:
+            self._resolved[target] = resolved
+        if self.cache:
+            self.cache.put_redirect(target, resolved)
+        return resolved
+    
+    def _record_skipped(self, url: str, reason: str) -> None:
+        """Remember a skipped page and its reason"""
+        logger.warning(f"Skipped {url}: {reason}")
+        with self._skipped_lock:
+            self.skipped[url] = reason
+    
+    def log_skipped(self) -> None:
+        """Log the pages skipped so far with their reasons"""
+        if not self.skipped:
+            return
+        logger.info(f"Skipped {len(self.skipped)} pages that were not HTML or too large:")
+        for url, reason in self.skipped.items():
+            logger.info(f"  {url}: {reason}")
+    
+    def _html_to_text(self, page: bytes) -> tuple:
+        """Convert page bytes to (title, text) with the text backend, in the process pool when configured"""
+        if self.parse_processes <= 0:
+            return self.to_text(page)
+        
+        with self._pool_lock:
+            if self._parse_pool is None:
+                self._parse_pool = process_pool(self.parse_processes)
+        return self._parse_pool.submit(self.to_text, page).result()
     
     def extract_content(self, url: str) -> Optional[dict]:
         """
         Extract clean content from a URL
         
+        Rate-limited fetches are retried (up to rate_limit_retries times)
+        once the host's Retry-After delay has passed.
+        
         Args:
             url: URL to extract content from
             
         Returns:
-            Dictionary with title and content, or None if extraction fails
+            Dictionary with title, content, url and fingerprint, or None if extraction fails
+        """
+        for attempt in range(self.rate_limit_retries + 1):
+            try:
+                return self._extract_content(url)
+            except RateLimited as e:
+                if attempt == self.rate_limit_retries or e.delay > self.max_retry_after:
+                    logger.error(f"Giving up on {url}: {str(e)}")
+                    return None
+                logger.info(f"Retrying {url} in {e.delay:.0f}s")
+                # The throttled host may differ from the URL's host after redirects
+                time.sleep(self.rate_limiter.ready_in(e.host))
+        return None
+    
+    def _extract_content(self, url: str) -> Optional[dict]:
+        """
+        Extract content from a URL once
+        
+        Args:
+            url: URL to extract content from
+            
+        Returns:
+            Dictionary with title, content, url and fingerprint, or None if extraction fails
+            
+        Raises:
+            RateLimited: If the server asks us to slow down
         """
         try:
+            # Text from another backend must not be served after text_backend changes
+            cache_key = f"{self.text_backend}:{canonicalize_url(url)}"
+            if self.cache:
+                cached = self.cache.get(cache_key)
+                if cached:
+                    logger.info(f"Using cached content for: {url}")
+                    return {
+                        **cached,
+                        'url': url,
+                        'fingerprint': content_fingerprint(cached['content'])
+                    }
+            
             logger.info(f"Extracting content from: {url}")
             
-            # Fetch the page
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
-            response.raise_for_status()
+            # Fetch the final page directly instead of going through redirect hops
+            target = self.resolve_url(url)
+            page = {}
             
-            # Use readability to extract main content
-            doc = Document(response.content)
+            def fetch_page() -> bytes:
+                if 'content' not in page:
+                    page['content'] = self._download_page(target)
+                return page['content']
             
-            # Get clean HTML
-            clean_html = doc.summary()
+            # Known applicant tracking systems expose structured postings
+            result = None
+            structured = find_structured_extractor(target)
+            if structured:
+                try:
+                    result = structured(self, target, fetch_page)
+                except (PageSkipped, RateLimited):
+                    raise
+                except Exception as e:
+                    logger.warning(f"Structured extraction failed for {url}, using readability: {str(e)}")
             
-            # Convert to plain text
-            soup = BeautifulSoup(clean_html, 'lxml')
-            text_content = soup.get_text(separator='\n', strip=True)
+            if not result:
+                title, text_content = self._html_to_text(fetch_page())
+                result = {
+                    'title': title,
+                    'content': text_content,
+                    'url': url
+                }
             
-            # Clean up extra whitespace
-            text_content = '\n'.join(line.strip() for line in text_content.split('\n') if line.strip())
+            result['url'] = url
+            result['fingerprint'] = content_fingerprint(result['content'])
             
-            result = {
-                'title': doc.title(),
-                'content': text_content,
-                'url': url
-            }
+            if self.cache:
+                # Structured extractors add fields such as location, salary and source
+                extra = {key: value for key, value in result.items()
+                         if key not in ('title', 'content', 'url', 'fingerprint')}
+                self.cache.put(cache_key, result['title'], result['content'], extra)
             
             logger.info(f"Successfully extracted content from {url}")
             return result
             
+        except PageSkipped as e:
+            self._record_skipped(url, str(e))
+            return None
+        except RateLimited:
+            raise
         except requests.exceptions.Timeout:
             logger.error(f"Timeout while fetching {url}")
             return None
@@ -86,12 +904,131 @@ class ContentExtractor:
         Returns:
             List of extracted content dictionaries
         """
-        results = []
-        for url in urls:
-            content = self.extract_content(url)
-            if content:
-                results.append(content)
+        results = [content for content in self.extract_many(urls) if content]
         
         logger.info(f"Successfully extracted {len(results)} out of {len(urls)} pages")
         return results
+    
+    def extract_many(self, urls: Iterable[str]) -> List[Optional[dict]]:
+        """
+        Extract content from multiple URLs, concurrently when configured
+        
+        At most max_concurrent_extractions pages are fetched at once and at
+        most max_extractions_per_host from the same host; URLs whose host is
+        at its limit, or throttled by its rate limit or a Retry-After, wait
+        while URLs for other hosts go ahead. The input may
+        be a lazy iterable (e.g. jobs streaming in from RSSParser.iter_jobs);
+        URLs are dispatched as they arrive.
+        
+        Args:
+            urls: URLs to extract content from
+            
+        Returns:
+            List aligned with the input: extracted content dictionaries, or
+            None where extraction failed
+            
+        Raises:
+            Any exception raised while iterating over `urls`
+        """
+        try:
+            if self.max_workers == 1:
+                return [self.extract_content(url) for url in urls]
+            return self._extract_concurrently(urls)
+        finally:
+            self.log_skipped()
+            if self.cache:
+                self.cache.log_stats()
+    
+    def _extract_concurrently(self, urls: Iterable[str]) -> List[Optional[dict]]:
+        """Concurrent implementation of extract_many"""
+        
+        # Read the input on a helper thread so a slow producer does not block dispatching
+        incoming: queue.Queue = queue.Queue()
+        
+        def feed_input():
+            try:
+                for url in urls:
+                    incoming.put(url)
+            except Exception as e:
+                # Hand the producer's error to the dispatcher so the run fails
+                # instead of ending early with partial results
+                incoming.put(e)
+            finally:
+                incoming.put(None)
+        
+        threading.Thread(target=feed_input, daemon=True).start()
+        
+        results: Dict[int, Optional[dict]] = {}
+        pending = deque()  # (index, url, host, attempt) not yet dispatched
+        running = {}  # future -> (index, url, host, attempt)
+        host_active: Dict[str, int] = {}
+        input_done = False
+        count = 0
+        # Seconds until the first throttled host frees up, set when nothing else can be dispatched
+        throttled_wait = None
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while not input_done or pending or running:
+                # Collect newly arrived URLs; block only when idle
+                while not input_done:
+                    idle = not running and (not pending or throttled_wait is not None)
+                    try:
+                        url = incoming.get(block=idle, timeout=throttled_wait if pending else None)
+                    except queue.Empty:
+                        break
+                    if url is None:
+                        input_done = True
+                        break
+                    if isinstance(url, Exception):
+                        raise url
+                    pending.append((count, url, urlsplit(unwrap_redirect(url)).hostname or '', 0))
+                    count += 1
+                    throttled_wait = None
+                
+                # Dispatch the first pending URL of every host that has capacity,
+                # skipping hosts that are throttled
+                throttled_wait = None
+                for item in list(pending):
+                    if len(running) >= self.max_workers:
+                        break
+                    index, url, host, attempt = item
+                    if host_active.get(host, 0) >= self.max_per_host:
+                        continue
+                    delay = self.rate_limiter.ready_in(host)
+                    if delay > self.max_retry_after:
+                        pending.remove(item)
+                        logger.error(f"Giving up on {url}: {host} is throttled for {delay:.0f}s")
+                        results[index] = None
+                        continue
+                    if delay > 0:
+                        throttled_wait = delay if throttled_wait is None else min(throttled_wait, delay)
+                        continue
+                    pending.remove(item)
+                    host_active[host] = host_active.get(host, 0) + 1
+                    running[executor.submit(self._extract_content, url)] = item
+                
+                if not running:
+                    if input_done and throttled_wait:
+                        time.sleep(throttled_wait)
+                    continue
+                
+                done, _ = wait(running, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, url, host, attempt = running.pop(future)
+                    host_active[host] -= 1
+                    try:
+                        results[index] = future.result()
+                    except RateLimited as e:
+                        if attempt < self.rate_limit_retries and e.delay <= self.max_retry_after:
+                            logger.info(f"Retrying {url} in {e.delay:.0f}s")
+                            # Wait on the host that throttled us (it may differ after redirects)
+                            pending.append((index, url, e.host, attempt + 1))
+                        else:
+                            logger.error(f"Giving up on {url}: {str(e)}")
+                            results[index] = None
+                    except Exception as e:
+                        logger.error(f"Error extracting content: {str(e)}")
+                        results[index] = None
+        
+        return [results[i] for i in range(count)]
 
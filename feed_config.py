@@ -21,6 +21,7 @@ class RSSFeed:
     priority: int = 1
     tags: List[str] = field(default_factory=list)
     description: str = ""
+    ordered: bool = False  # Entries are strictly newest-first; stop at the first stale one
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
@@ -30,7 +31,8 @@ class RSSFeed:
             'enabled': self.enabled,
             'priority': self.priority,
             'tags': self.tags,
-            'description': self.description
+            'description': self.description,
+            'ordered': self.ordered
         }
     
     @classmethod
@@ -42,7 +44,8 @@ class RSSFeed:
             enabled=data.get('enabled', True),
             priority=data.get('priority', 1),
             tags=data.get('tags', []),
-            description=data.get('description', '')
+            description=data.get('description', ''),
+            ordered=data.get('ordered', False)
         )
 
 
@@ -0,0 +1,156 @@
+"""
+Feed Health Module
+Tracks per-feed failures and latency and skips feeds that keep failing
+"""
+
+import math
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from feed_state import FeedStateStore
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """
+    Nearest-rank percentile of a list of values
+
+    Args:
+        values: Sample values
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The percentile value, or None for an empty list
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class FeedHealthTracker:
+    """Per-feed health state with a circuit breaker and persisted backoff"""
+
+    def __init__(self, state_store: FeedStateStore, settings: Optional[Dict] = None):
+        """
+        Initialize the health tracker
+
+        Args:
+            state_store: Store holding each feed's 'health' section
+            settings: Optional ``settings`` block from rss_feeds.json
+        """
+        settings = settings or {}
+        self.state_store = state_store
+        # Consecutive failures before the circuit opens
+        self.failure_threshold = int(settings.get('circuit_failure_threshold', 3))
+        self.base_backoff = timedelta(hours=float(settings.get('circuit_base_backoff_hours', 6)))
+        self.max_backoff = timedelta(hours=float(settings.get('circuit_max_backoff_hours', 24 * 14)))
+        self.latency_samples = int(settings.get('latency_samples', 20))
+
+    def allow(self, feed_url: str, now: Optional[datetime] = None) -> bool:
+        """
+        Check whether a feed may be fetched this run
+
+        Once the backoff window has passed, the feed is let through again
+        as a probe; a success closes the circuit, a failure reopens it
+        with a longer window.
+
+        Args:
+            feed_url: Feed URL
+            now: Current time (default: datetime.now())
+
+        Returns:
+            False while the feed's circuit is open, True otherwise
+        """
+        now = now or datetime.now()
+        open_until = self.state_store.get(feed_url, 'health').get('open_until')
+        if not open_until:
+            return True
+        try:
+            return now >= datetime.fromisoformat(open_until)
+        except ValueError:
+            return True
+
+    def record_success(self, feed_url: str, latency: float, now: Optional[datetime] = None) -> None:
+        """
+        Record a successful fetch and close the feed's circuit
+
+        Args:
+            feed_url: Feed URL
+            latency: Fetch and parse time in seconds
+            now: Current time (default: datetime.now())
+        """
+        now = now or datetime.now()
+        health = self.state_store.get(feed_url, 'health')
+        if health.get('open_until'):
+            logger.info(f"  Circuit closed for {feed_url} after a successful probe")
+
+        self.state_store.update(feed_url, 'health', {
+            'consecutive_failures': 0,
+            'open_until': None,
+            'last_success': now.isoformat(timespec='seconds'),
+            'latencies_ms': self._add_latency(health, latency)
+        })
+
+    def record_failure(self, feed_url: str, error: str, latency: float,
+                       now: Optional[datetime] = None) -> None:
+        """
+        Record a failed fetch, opening the circuit after repeated failures
+
+        The skip window doubles with every failure past the threshold, up to
+        circuit_max_backoff_hours.
+
+        Args:
+            feed_url: Feed URL
+            error: Error message
+            latency: Time spent before the failure, in seconds
+            now: Current time (default: datetime.now())
+        """
+        now = now or datetime.now()
+        health = self.state_store.get(feed_url, 'health')
+        failures = int(health.get('consecutive_failures', 0)) + 1
+
+        open_until = None
+        if failures >= self.failure_threshold:
+            # Double step by step up to the cap; 2 ** failures would overflow timedelta
+            backoff = self.base_backoff
+            for _ in range(failures - self.failure_threshold):
+                if backoff >= self.max_backoff:
+                    break
+                backoff *= 2
+            backoff = min(self.max_backoff, backoff)
+            open_until = (now + backoff).isoformat(timespec='seconds')
+            logger.warning(f"  Circuit open for {feed_url} until {open_until} ({failures} consecutive failures)")
+
+        self.state_store.update(feed_url, 'health', {
+            'consecutive_failures': failures,
+            'total_failures': int(health.get('total_failures', 0)) + 1,
+            'last_error': error[:300],
+            'last_error_at': now.isoformat(timespec='seconds'),
+            'open_until': open_until,
+            'latencies_ms': self._add_latency(health, latency)
+        })
+
+    def summary(self, feed_url: str) -> Dict:
+        """
+        Get a feed's health summary
+
+        Args:
+            feed_url: Feed URL
+
+        Returns:
+            Dictionary with the stored health fields plus 'p50_ms' / 'p95_ms'
+        """
+        health = self.state_store.get(feed_url, 'health')
+        latencies = health.get('latencies_ms', [])
+        health['p50_ms'] = percentile(latencies, 50)
+        health['p95_ms'] = percentile(latencies, 95)
+        return health
+
+    def _add_latency(self, health: Dict, latency: float) -> List[int]:
+        """Append a latency sample, keeping only the most recent ones"""
+        latencies = list(health.get('latencies_ms', []))
+        latencies.append(int(latency * 1000))
+        return latencies[-self.latency_samples:]
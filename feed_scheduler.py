@@ -0,0 +1,133 @@
+"""
+Feed Scheduler Module
+Decides which feeds are due for polling based on their historical yield
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from feed_state import FeedStateStore
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Hours kept free at the end of the look-back window, so a run that starts
+# a little late (cron drift) still covers everything since the last poll
+WINDOW_MARGIN_HOURS = 2
+
+
+class FeedScheduler:
+    """Adaptive per-feed polling schedule with exponential backoff on quiet feeds"""
+
+    def __init__(self, state_store: FeedStateStore, settings: Optional[Dict] = None,
+                 max_interval_hours: Optional[float] = None):
+        """
+        Initialize the scheduler
+
+        Args:
+            state_store: Store holding each feed's 'schedule' section
+            settings: Optional ``settings`` block from rss_feeds.json
+            max_interval_hours: Look-back window the polling interval must
+                stay inside (e.g. days_back * 24); WINDOW_MARGIN_HOURS is
+                kept free, and it overrides the configured maximum when lower
+        """
+        settings = settings or {}
+        self.state_store = state_store
+        self.min_interval = float(settings.get('min_poll_interval_hours', 0))
+        self.base_interval = float(settings.get('base_poll_interval_hours', 24))
+        self.max_interval = float(settings.get('max_poll_interval_hours', 168))
+        if max_interval_hours is not None:
+            self.max_interval = min(self.max_interval, max(0.0, max_interval_hours - WINDOW_MARGIN_HOURS))
+        self.backoff = float(settings.get('poll_backoff_factor', 2.0))
+        # Scheduled runs drift a little; treat feeds due within this window as due
+        self.grace = timedelta(minutes=float(settings.get('poll_grace_minutes', 60)))
+        # Weight of the latest run in the new-entry rate moving average
+        self.rate_alpha = 0.3
+        # Schedules recorded this run, stored by commit()
+        self._pending: Dict[str, Dict] = {}
+
+    def is_due(self, feed_url: str, now: Optional[datetime] = None) -> bool:
+        """
+        Check whether a feed should be polled this run
+
+        Args:
+            feed_url: Feed URL
+            now: Current time (default: datetime.now())
+
+        Returns:
+            True if the feed has never been polled or its next poll time has passed
+        """
+        now = now or datetime.now()
+        next_due = self.state_store.get(feed_url, 'schedule').get('next_due')
+        if not next_due:
+            return True
+        try:
+            return now + self.grace >= datetime.fromisoformat(next_due)
+        except ValueError:
+            return True
+
+    def next_due(self, feed_url: str) -> Optional[str]:
+        """Get the stored next poll time of a feed (ISO format), if any"""
+        return self.state_store.get(feed_url, 'schedule').get('next_due')
+
+    def record(self, feed_url: str, stats: Dict, jobs: List[Dict],
+               now: Optional[datetime] = None) -> int:
+        """
+        Record the outcome of polling a feed and schedule its next poll
+
+        Active feeds have their interval halved (down to the minimum); feeds
+        with no new entries back off exponentially (up to the maximum).
+        Failed polls leave the schedule untouched. The new schedule is only
+        stored by commit(), so a run that fails later does not mark the
+        feed as freshly polled.
+
+        Args:
+            feed_url: Feed URL
+            stats: The feed's feed_stats entry from RSSParser
+            jobs: Jobs extracted from the feed this run
+            now: Current time (default: datetime.now())
+
+        Returns:
+            Number of entries newer than anything seen in earlier polls
+        """
+        if 'error' in stats:
+            return 0
+
+        now = now or datetime.now()
+        schedule = self.state_store.get(feed_url, 'schedule')
+        newest_seen = schedule.get('newest_entry')
+
+        published = [job['published'] for job in jobs if job.get('published')]
+        if newest_seen:
+            new_entries = sum(1 for p in published if p > newest_seen)
+        else:
+            new_entries = len(jobs)
+        newest = max(published + ([newest_seen] if newest_seen else []), default=None)
+
+        interval = float(schedule.get('interval_hours', self.base_interval))
+        if new_entries:
+            interval = max(self.min_interval, interval / self.backoff)
+        else:
+            interval = min(self.max_interval, max(interval, 1.0) * self.backoff)
+
+        rate = float(schedule.get('new_entry_rate', new_entries))
+        rate = self.rate_alpha * new_entries + (1 - self.rate_alpha) * rate
+
+        self._pending[feed_url] = {
+            'interval_hours': round(interval, 2),
+            'next_due': (now + timedelta(hours=interval)).isoformat(timespec='seconds'),
+            'last_polled': now.isoformat(timespec='seconds'),
+            'last_change': now.isoformat(timespec='seconds') if new_entries else schedule.get('last_change'),
+            'newest_entry': newest,
+            'polls': int(schedule.get('polls', 0)) + 1,
+            'total_yield': int(schedule.get('total_yield', 0)) + stats.get('jobs_found', 0),
+            'new_entry_rate': round(rate, 3)
+        }
+
+        return new_entries
+
+    def commit(self) -> None:
+        """Store the schedules recorded this run (the caller saves the state store)"""
+        for feed_url, schedule in self._pending.items():
+            self.state_store.update(feed_url, 'schedule', schedule)
+        self._pending = {}
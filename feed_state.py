@@ -0,0 +1,117 @@
+"""
+Feed State Module
+Persists per-feed state (HTTP cache validators, statistics) between runs
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Optional
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def default_state_file(config_file: str = 'rss_feeds.json') -> str:
+    """
+    Get the state file path that lives beside a feed configuration file
+
+    Args:
+        config_file: Path to the feed JSON configuration file
+
+    Returns:
+        Path such as ``rss_feeds.state.json``
+    """
+    base, _ = os.path.splitext(config_file)
+    return f"{base}.state.json"
+
+
+class FeedStateStore:
+    """JSON-backed store of per-feed state, keyed by feed URL and section"""
+
+    def __init__(self, state_file: Optional[str] = None):
+        """
+        Initialize the state store
+
+        Args:
+            state_file: Path to the JSON state file (default: beside rss_feeds.json)
+        """
+        self.state_file = state_file or default_state_file()
+        self.state: Dict[str, Dict[str, Dict]] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> bool:
+        """
+        Load state from disk
+
+        Returns:
+            True if state was loaded, False otherwise
+        """
+        try:
+            if not os.path.exists(self.state_file):
+                return False
+
+            with open(self.state_file, 'r') as f:
+                self.state = json.load(f).get('feeds', {})
+
+            logger.debug(f"Loaded state for {len(self.state)} feeds from {self.state_file}")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Could not load feed state from {self.state_file}: {e}")
+            self.state = {}
+            return False
+
+    def save(self) -> bool:
+        """
+        Save state to disk
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with self._lock:
+                data = {'feeds': self.state}
+                tmp_file = f"{self.state_file}.tmp"
+                with open(tmp_file, 'w') as f:
+                    json.dump(data, f, indent=2, sort_keys=True)
+                os.replace(tmp_file, self.state_file)
+
+            logger.debug(f"Saved state for {len(self.state)} feeds to {self.state_file}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving feed state: {e}")
+            return False
+
+    def get(self, feed_url: str, section: str) -> Dict:
+        """
+        Get a copy of one section of a feed's state
+
+        Args:
+            feed_url: Feed URL
+            section: Section name (e.g. 'http')
+
+        Returns:
+            Dictionary with the stored values (empty if none)
+        """
+        with self._lock:
+            return dict(self.state.get(feed_url, {}).get(section, {}))
+
+    def update(self, feed_url: str, section: str, values: Dict) -> None:
+        """
+        Merge values into one section of a feed's state
+
+        Args:
+            feed_url: Feed URL
+            section: Section name (e.g. 'http')
+            values: Values to store; keys with a None value are removed
+        """
+        with self._lock:
+            entry = self.state.setdefault(feed_url, {}).setdefault(section, {})
+            for key, value in values.items():
+                if value is None:
+                    entry.pop(key, None)
+                else:
+                    entry[key] = value
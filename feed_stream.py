@@ -0,0 +1,186 @@
+"""
+Streaming Feed Parser Module
+Incrementally parses RSS/Atom feeds so time-ordered feeds can stop early
+"""
+
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, Optional
+from lxml import etree
+
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+
+class BoundedReader:
+    """File-like reader over streamed chunks that enforces a size cap and deadline"""
+
+    def __init__(self, chunks: Iterator[bytes], max_bytes: int, deadline: float, timeout: float):
+        """
+        Initialize the reader
+
+        Args:
+            chunks: Iterator of body chunks (e.g. response.iter_content())
+            max_bytes: Maximum number of bytes that may be read
+            deadline: time.monotonic() value after which reading fails
+            timeout: Timeout in seconds, used in the error message
+        """
+        self._chunks = chunks
+        self._buffer = b''
+        self._size = 0
+        self.max_bytes = max_bytes
+        self.deadline = deadline
+        self.timeout = timeout
+
+    def _next_chunk(self) -> bytes:
+        """Pull the next chunk, enforcing the limits"""
+        chunk = next(self._chunks, b'')
+        self._size += len(chunk)
+        if self._size > self.max_bytes:
+            raise ValueError(f"Feed exceeds the {self.max_bytes} byte limit")
+        if time.monotonic() > self.deadline:
+            raise TimeoutError(f"Feed download exceeded {self.timeout}s")
+        return chunk
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read up to size bytes (all remaining bytes if size < 0)
+
+        Args:
+            size: Maximum number of bytes to return
+
+        Returns:
+            Bytes read; empty at end of stream
+        """
+        if size is None or size < 0:
+            parts = [self._buffer]
+            self._buffer = b''
+            while True:
+                chunk = self._next_chunk()
+                if not chunk:
+                    return b''.join(parts)
+                parts.append(chunk)
+
+        while len(self._buffer) < size:
+            chunk = self._next_chunk()
+            if not chunk:
+                break
+            self._buffer += chunk
+
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _parse_date(value: Optional[str]) -> Optional[tuple]:
+    """Parse an RFC 822 or ISO 8601 date into a UTC time tuple (like feedparser)"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return tuple(parsed.astimezone(timezone.utc).timetuple())
+
+
+def _child_text(element, *names: str) -> Optional[str]:
+    """Get the text of the first child with one of the given tags"""
+    for name in names:
+        child = element.find(name)
+        if child is not None and child.text:
+            return child.text.strip()
+    return None
+
+
+def _atom_entry(element) -> Dict:
+    """Convert an Atom <entry> element into a feedparser-style entry dict"""
+    link = None
+    for link_el in element.findall(f'{ATOM_NS}link'):
+        if link_el.get('rel', 'alternate') == 'alternate':
+            link = link_el.get('href')
+            break
+
+    entry = {
+        'id': _child_text(element, f'{ATOM_NS}id'),
+        'title': _child_text(element, f'{ATOM_NS}title'),
+        'link': link,
+        'summary': _child_text(element, f'{ATOM_NS}summary', f'{ATOM_NS}content'),
+        'published_parsed': _parse_date(_child_text(element, f'{ATOM_NS}published')),
+        'updated_parsed': _parse_date(_child_text(element, f'{ATOM_NS}updated')),
+    }
+    return {key: value for key, value in entry.items() if value is not None}
+
+
+def _rss_item(element) -> Dict:
+    """Convert an RSS <item> element into a feedparser-style entry dict"""
+    entry = {
+        'id': _child_text(element, 'guid'),
+        'title': _child_text(element, 'title'),
+        'link': _child_text(element, 'link'),
+        'summary': _child_text(element, 'description'),
+        'published_parsed': _parse_date(_child_text(element, 'pubDate')),
+    }
+    return {key: value for key, value in entry.items() if value is not None}
+
+
+def iter_feed_entries(source) -> Iterator[Dict]:
+    """
+    Incrementally parse RSS 2.0 / Atom entries without building the whole tree
+
+    Args:
+        source: File-like object (or path) with the feed XML
+
+    Yields:
+        Entry dictionaries with the same keys parse_feed_content produces
+    """
+    context = etree.iterparse(
+        source,
+        events=('end',),
+        tag=(f'{ATOM_NS}entry', 'item'),
+        resolve_entities=False,
+        no_network=True,
+        recover=True
+    )
+    for _, element in context:
+        if element.tag == f'{ATOM_NS}entry':
+            yield _atom_entry(element)
+        else:
+            yield _rss_item(element)
+
+        # Free processed entries so memory stays flat on large feeds
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+def parse_ordered_feed(source, cutoff_date: datetime) -> Dict:
+    """
+    Parse a newest-first feed, stopping at the first entry older than the cutoff
+
+    Args:
+        source: File-like object (or path) with the feed XML
+        cutoff_date: Naive UTC-comparable cutoff (as used by RSSParser)
+
+    Returns:
+        Dictionary shaped like parse_feed_content's result, plus 'truncated'
+        (True if parsing stopped before the end of the feed)
+    """
+    entries = []
+    truncated = False
+    try:
+        for entry in iter_feed_entries(source):
+            date = entry.get('published_parsed') or entry.get('updated_parsed')
+            if date and datetime(*date[:6]) < cutoff_date:
+                truncated = True
+                break
+            entries.append(entry)
+    except etree.XMLSyntaxError as e:
+        return {'bozo': True, 'bozo_exception': str(e), 'entries': entries, 'truncated': truncated}
+
+    return {'bozo': False, 'bozo_exception': None, 'entries': entries, 'truncated': truncated}
@@ -4,27 +4,111 @@ Uses Gemini API to analyze job postings and determine suitability
 """
 
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
+import hashlib
+import json
 import os
+import re
+from analysis_cache import AnalysisCache, DEFAULT_CACHE_FILE
+from content_condenser import CHARS_PER_TOKEN, condense
+from content_extractor import content_fingerprint
+from rate_limiter import QuotaLimiter
 from logger import get_logger
 
 logger = get_logger(__name__)
 
 
+# Bump whenever the prompt templates or response parsing change, so cached
+# analyses made with the old prompt are not reused
+PROMPT_VERSION = 2
+
+# Job text tokens sent per job when not set in settings
+DEFAULT_PROMPT_TOKEN_BUDGET = 750
+# Tokens reserved for the model's answer when estimating a request
+RESPONSE_TOKENS = 400
+# Accepted analysis cache modes (see JobAnalyzer)
+CACHE_MODES = ('use', 'refresh', 'bypass')
+
+
 class JobAnalyzer:
     """Analyze job postings using Gemini API"""
     
-    def __init__(self, api_key: str, user_profile: Dict):
+    def __init__(self, api_key: str, user_profile: Dict, settings: Optional[Dict] = None,
+                 cache_mode: Optional[str] = None):
         """
         Initialize job analyzer with Gemini API
         
         Args:
             api_key: Gemini API key
             user_profile: Dictionary containing user's skills, experience, etc.
+            settings: Optional ``settings`` block from user_profile.json
+            cache_mode: Override for the analysis cache: 'use', 'refresh'
+                (analyze everything again and store the results) or 'bypass'
+                (neither read nor write the cache)
         """
+        settings = settings or {}
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-pro')
+        self.model_name = 'gemini-pro'
+        self.model = genai.GenerativeModel(self.model_name)
         self.user_profile = user_profile
+        # Job text is condensed to this many tokens, keeping requirements and
+        # responsibilities over company boilerplate
+        self.prompt_token_budget = int(settings.get('prompt_token_budget', DEFAULT_PROMPT_TOKEN_BUDGET))
+        # Identifies the profile, prompt and model an analysis was made for, so
+        # cached analyses are only reused while all three are unchanged
+        self.profile_key = hashlib.blake2b(
+            json.dumps([self.model_name, PROMPT_VERSION, self.prompt_token_budget, user_profile],
+                       sort_keys=True, default=str).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        
+        # Jobs analyzed in parallel, within the account's per-minute quotas
+        self.max_concurrency = max(1, int(settings.get('analysis_concurrency', 1)))
+        self.limiter = QuotaLimiter(settings.get('gemini_rpm', 60), settings.get('gemini_tpm'))
+        self.quota_retries = int(settings.get('gemini_quota_retries', 3))
+        # Jobs packed into one request (1 sends every job on its own)
+        self.batch_size = max(1, int(settings.get('analysis_batch_size', 1)))
+        
+        # Analyses of unchanged postings are reused across runs
+        if cache_mode is None:
+            if not settings.get('analysis_cache', False):
+                cache_mode = 'bypass'
+            else:
+                cache_mode = 'refresh' if settings.get('analysis_cache_refresh', False) else 'use'
+        if cache_mode not in CACHE_MODES:
+            raise ValueError(f"Unknown analysis cache mode '{cache_mode}' (expected use, refresh or bypass)")
+        self.cache_mode = cache_mode
+        self.cache = None
+        if cache_mode != 'bypass':
+            self.cache = AnalysisCache(
+                settings.get('analysis_cache_file', DEFAULT_CACHE_FILE),
+                max_age_days=float(settings.get('analysis_cache_max_age_days', 30)),
+                max_entries=int(settings.get('analysis_cache_max_entries', 5000))
+            )
+    
+    def close(self) -> None:
+        """Close the analysis cache"""
+        if self.cache:
+            self.cache.close()
+    
+    def cache_key(self, job_content: Dict) -> str:
+        """
+        Get the analysis cache key of a job
+        
+        Args:
+            job_content: Job content dictionary from ContentExtractor
+            
+        Returns:
+            Hash of the normalized title and content, the profile, the
+            prompt version and the model
+        """
+        fingerprint = job_content.get('fingerprint') or content_fingerprint(job_content.get('content', ''))
+        title = ' '.join(str(job_content.get('title') or '').lower().split())
+        return hashlib.blake2b(
+            f"{self.profile_key}\n{fingerprint}\n{title}".encode('utf-8'), digest_size=16
+        ).hexdigest()
     
     def analyze_job(self, job_content: Dict) -> Optional[Dict]:
         """
@@ -34,7 +118,8 @@ class JobAnalyzer:
             job_content: Dictionary with job title, content, and URL
             
         Returns:
-            Dictionary with analysis results including suitability score and reasoning
+            Dictionary with analysis results including suitability score and
+            reasoning, or None if the job could not be analyzed
         """
         try:
             logger.info(f"Analyzing job: {job_content.get('title', 'Unknown')}")
@@ -43,7 +128,7 @@ class JobAnalyzer:
             prompt = self._create_analysis_prompt(job_content)
             
             # Generate analysis
-            response = self.model.generate_content(prompt)
+            response = self._generate(prompt)
             
             # Parse response
             analysis = self._parse_response(response.text, job_content)
@@ -54,24 +139,76 @@ class JobAnalyzer:
             logger.error(f"Error analyzing job {job_content.get('url', 'Unknown')}: {str(e)}")
             return None
     
+    def analyze_batch(self, job_contents: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Analyze several job postings with a single request
+        
+        The model is asked for a JSON object keyed by job id. Jobs whose
+        result is missing or malformed are analyzed again with single calls.
+        
+        Args:
+            job_contents: Job content dictionaries
+            
+        Returns:
+            List aligned with the input: analysis dictionaries, or None where
+            analysis failed
+        """
+        if len(job_contents) == 1:
+            return [self.analyze_job(job_contents[0])]
+        
+        jobs = {f"job-{i + 1}": job_content for i, job_content in enumerate(job_contents)}
+        results: Dict[str, Dict] = {}
+        try:
+            logger.info(f"Analyzing batch of {len(jobs)} jobs")
+            response = self._generate(self._create_batch_prompt(jobs), RESPONSE_TOKENS * len(jobs))
+            results = self._parse_batch_response(response.text, jobs)
+        except Exception as e:
+            logger.error(f"Error analyzing batch of {len(jobs)} jobs: {str(e)}")
+        
+        retry = [job_id for job_id in jobs if job_id not in results]
+        if retry:
+            logger.warning(f"Batch returned no valid result for {len(retry)} of {len(jobs)} jobs, analyzing them singly")
+            for job_id in retry:
+                results[job_id] = self.analyze_job(jobs[job_id])
+        
+        return [results[job_id] for job_id in jobs]
+    
+    def _generate(self, prompt: str, response_tokens: int = RESPONSE_TOKENS):
+        """
+        Call the model within the rate limits, retrying on quota errors
+        
+        Args:
+            prompt: Prompt text
+            response_tokens: Expected size of the answer, for the token budget
+            
+        Returns:
+            Model response
+        """
+        for attempt in range(self.quota_retries + 1):
+            self.limiter.acquire(len(prompt) // CHARS_PER_TOKEN + response_tokens)
+            try:
+                return self.model.generate_content(prompt)
+            except google_exceptions.ResourceExhausted:
+                if attempt == self.quota_retries:
+                    raise
+                delay = 10 * 2 ** attempt
+                logger.warning(f"Gemini quota exceeded, retrying in {delay}s")
+                self.limiter.pause(delay)
+    
     def _create_analysis_prompt(self, job_content: Dict) -> str:
         """Create prompt for Gemini API"""
         
         prompt = f"""
 You are a job matching expert. Analyze the following job posting and determine if it's suitable for the candidate.
 
-CANDIDATE PROFILE:
-- Skills: {self.user_profile.get('skills', 'Not specified')}
-- Years of Experience: {self.user_profile.get('experience_years', 'Not specified')}
-- Preferred Locations: {self.user_profile.get('preferred_locations', 'Not specified')}
-- Preferred Job Titles: {self.user_profile.get('job_titles', 'Not specified')}
+{self._profile_section()}
 
 JOB POSTING:
 Title: {job_content.get('title', 'Unknown')}
 URL: {job_content.get('url', 'Unknown')}
 
 Content:
-{job_content.get('content', 'No content available')[:3000]}
+{self._job_text(job_content)}
 
 INSTRUCTIONS:
 1. Analyze the job requirements and match them against the candidate's profile
@@ -94,12 +231,134 @@ RECOMMENDATION: [brief recommendation in 1-2 sentences]
 """
         return prompt
     
+    def _job_text(self, job_content: Dict) -> str:
+        """Job text for a prompt, condensed to the prompt token budget"""
+        content = job_content.get('content') or 'No content available'
+        return condense(content, self.prompt_token_budget)
+    
+    def _profile_section(self) -> str:
+        """Candidate profile block shared by the single and batch prompts"""
+        return f"""CANDIDATE PROFILE:
+- Skills: {self.user_profile.get('skills', 'Not specified')}
+- Years of Experience: {self.user_profile.get('experience_years', 'Not specified')}
+- Preferred Locations: {self.user_profile.get('preferred_locations', 'Not specified')}
+- Preferred Job Titles: {self.user_profile.get('job_titles', 'Not specified')}"""
+    
+    def _create_batch_prompt(self, jobs: Dict[str, Dict]) -> str:
+        """Create one prompt for several jobs, keyed by job id"""
+        
+        postings = '\n\n'.join(
+            f"""=== {job_id} ===
+Title: {job_content.get('title', 'Unknown')}
+URL: {job_content.get('url', 'Unknown')}
+
+Content:
+{self._job_text(job_content)}"""
+            for job_id, job_content in jobs.items()
+        )
+        
+        prompt = f"""
+You are a job matching expert. Analyze each of the following job postings and determine if it's suitable for the candidate.
+
+{self._profile_section()}
+
+JOB POSTINGS:
+
+{postings}
+
+INSTRUCTIONS:
+1. Analyze each job's requirements and match them against the candidate's profile
+2. Provide a suitability score from 0-100 (0 = not suitable, 100 = perfect match)
+3. List key matching points
+4. List any gaps or concerns
+5. Provide a brief recommendation
+
+Respond with ONLY a JSON object with one entry per job id ({', '.join(jobs)}), in this form:
+{{
+  "job-1": {{
+    "score": 75,
+    "matching_points": ["point 1", "point 2"],
+    "gaps": ["gap 1"],
+    "recommendation": "brief recommendation in 1-2 sentences"
+  }}
+}}
+"""
+        return prompt
+    
+    def _parse_batch_response(self, response_text: str, jobs: Dict[str, Dict]) -> Dict[str, Dict]:
+        """
+        Parse a batch response, keeping only well-formed results
+        
+        Args:
+            response_text: Model output
+            jobs: Job id -> job content dictionary
+            
+        Returns:
+            Job id -> analysis dictionary, for the jobs with a valid result
+        """
+        # Models often wrap JSON in a Markdown code fence
+        text = re.sub(r'^```(?:json)?\s*|\s*```$', '', response_text.strip())
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            logger.error(f"Batch response is not valid JSON: {str(e)}")
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        
+        analyses = {}
+        for job_id, job_content in jobs.items():
+            result = data.get(job_id)
+            if not isinstance(result, dict):
+                continue
+            
+            score = result.get('score')
+            if isinstance(score, str) and score.strip().isdigit():
+                score = int(score.strip())
+            if isinstance(score, bool) or not isinstance(score, (int, float)) or not 0 <= score <= 100:
+                logger.debug(f"Invalid score for {job_id}: {score!r}")
+                continue
+            
+            lists = [result.get('matching_points', []), result.get('gaps', [])]
+            if not all(isinstance(items, list) for items in lists):
+                logger.debug(f"Invalid matching_points/gaps for {job_id}")
+                continue
+            recommendation = result.get('recommendation', '')
+            if not isinstance(recommendation, str):
+                continue
+            
+            analyses[job_id] = self._build_analysis(
+                job_content, int(score),
+                [str(item) for item in lists[0]], [str(item) for item in lists[1]],
+                recommendation.strip()
+            )
+        return analyses
+    
+    def _build_analysis(self, job_content: Dict, score: int, matching_points: List[str],
+                        gaps: List[str], recommendation: str) -> Dict:
+        """Assemble an analysis result dictionary"""
+        return {
+            'title': job_content.get('title', 'Unknown'),
+            'url': job_content.get('url', 'Unknown'),
+            'score': score,
+            'matching_points': matching_points,
+            'gaps': gaps,
+            'recommendation': recommendation,
+            'suitable': score >= 60  # Consider jobs with 60+ score as suitable
+        }
+    
     def _parse_response(self, response_text: str, job_content: Dict) -> Dict:
-        """Parse Gemini API response"""
+        """
+        Parse Gemini API response
+        
+        Returns:
+            Analysis dictionary; a response without a valid score gives a
+            score-0 placeholder flagged with 'analysis_failed'
+        """
         
         try:
             lines = response_text.strip().split('\n')
-            score = 0
+            score = None
             matching_points = []
             gaps = []
             recommendation = ""
@@ -111,7 +370,9 @@ RECOMMENDATION: [brief recommendation in 1-2 sentences]
                 
                 if line.startswith('SCORE:'):
                     score_str = line.replace('SCORE:', '').strip()
-                    score = int(''.join(filter(str.isdigit, score_str)))
+                    # First number only, so "85/100" is 85
+                    match = re.search(r'\d+', score_str)
+                    score = int(match.group(0)) if match else None
                 elif line.startswith('MATCHING_POINTS:'):
                     current_section = 'matching'
                 elif line.startswith('GAPS:'):
@@ -126,44 +387,63 @@ RECOMMENDATION: [brief recommendation in 1-2 sentences]
                 elif current_section == 'recommendation' and line:
                     recommendation += ' ' + line
             
-            return {
-                'title': job_content.get('title', 'Unknown'),
-                'url': job_content.get('url', 'Unknown'),
-                'score': score,
-                'matching_points': matching_points,
-                'gaps': gaps,
-                'recommendation': recommendation.strip(),
-                'suitable': score >= 60  # Consider jobs with 60+ score as suitable
-            }
+            if score is None or not 0 <= score <= 100:
+                raise ValueError(f"no valid SCORE in response (got {score!r})")
+            
+            return self._build_analysis(job_content, score, matching_points, gaps, recommendation.strip())
             
         except Exception as e:
-            logger.error(f"Error parsing response: {str(e)}")
+            logger.error(f"Error parsing response for {job_content.get('url', 'Unknown')}: {str(e)}")
+            # Flagged so the failure is reported but never cached
             return {
-                'title': job_content.get('title', 'Unknown'),
-                'url': job_content.get('url', 'Unknown'),
-                'score': 0,
-                'matching_points': [],
-                'gaps': [],
-                'recommendation': 'Error analyzing job',
-                'suitable': False
+                **self._build_analysis(job_content, 0, [], [], 'Error analyzing job'),
+                'analysis_failed': True
             }
     
     def analyze_multiple_jobs(self, job_contents: List[Dict]) -> List[Dict]:
         """
         Analyze multiple job postings
         
+        Jobs found in the analysis cache are not sent to Gemini again. With
+        analysis_batch_size above 1, jobs are sent in batches of that
+        many per request. With analysis_concurrency above 1, jobs (or
+        batches) are analyzed in parallel threads; requests are still paced
+        by gemini_rpm / gemini_tpm, and the result is the same as a serial run.
+        
         Args:
             job_contents: List of job content dictionaries
             
         Returns:
             List of analysis results, sorted by suitability score
         """
-        analyses = []
+        results: List[Optional[Dict]] = [None] * len(job_contents)
+        to_analyze = list(range(len(job_contents)))
+        if self.cache and self.cache_mode == 'use':
+            to_analyze = []
+            for i, job_content in enumerate(job_contents):
+                cached = self.cache.get(self.cache_key(job_content))
+                if cached:
+                    results[i] = {**cached, 'title': job_content.get('title', 'Unknown'),
+                                  'url': job_content.get('url', 'Unknown')}
+                else:
+                    to_analyze.append(i)
+        
+        pending = [job_contents[i] for i in to_analyze]
+        batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        if self.max_concurrency > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                batch_results = list(executor.map(self.analyze_batch, batches))
+        else:
+            batch_results = [self.analyze_batch(batch) for batch in batches]
+        
+        for i, analysis in zip(to_analyze, (analysis for batch in batch_results for analysis in batch)):
+            results[i] = analysis
+            if self.cache and analysis and not analysis.get('analysis_failed'):
+                self.cache.put(self.cache_key(job_contents[i]), analysis)
+        if self.cache:
+            self.cache.log_stats()
         
-        for job_content in job_contents:
-            analysis = self.analyze_job(job_content)
-            if analysis:
-                analyses.append(analysis)
+        analyses = [analysis for analysis in results if analysis]
         
         # Sort by score (highest first)
         analyses.sort(key=lambda x: x['score'], reverse=True)
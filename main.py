@@ -3,14 +3,19 @@ Main Job Automation Script
 Orchestrates RSS parsing, content extraction, job analysis, and email notifications
 """
 
+import itertools
 import os
 import sys
 from dotenv import load_dotenv
 from rss_parser import RSSParser
 from content_extractor import ContentExtractor
-from job_analyzer import JobAnalyzer
+from job_analyzer import JobAnalyzer, CACHE_MODES
 from email_sender import EmailSender
 from feed_config import FeedConfigManager
+from feed_state import FeedStateStore, default_state_file
+from seen_store import SeenStore, DEFAULT_DB_FILE, job_key
+from near_duplicate import NearDuplicateDetector
+from prefilter import JobPrefilter
 from user_config import UserConfigManager
 from logger import get_logger, log_section, log_separator
 
@@ -27,9 +32,15 @@ def load_config():
         'smtp_port': int(os.getenv('SMTP_PORT', '587')),
         'smtp_username': os.getenv('SMTP_USERNAME'),
         'smtp_password': os.getenv('SMTP_PASSWORD'),
-        'email_to': os.getenv('EMAIL_TO')
+        'email_to': os.getenv('EMAIL_TO'),
+        # ANALYSIS_CACHE=use / refresh / bypass overrides the analysis cache settings for one run
+        'analysis_cache_mode': os.getenv('ANALYSIS_CACHE') or None
     }
 
+    if config['analysis_cache_mode'] not in (None,) + CACHE_MODES:
+        raise ValueError(f"Invalid ANALYSIS_CACHE '{config['analysis_cache_mode']}' "
+                         f"(expected {', '.join(CACHE_MODES)})")
+
     # Load RSS feeds using FeedConfigManager
     feed_manager = FeedConfigManager('rss_feeds.json')
 
@@ -104,11 +115,79 @@ def main():
         # Get settings from user profile
         days_back = config['user_settings'].get('days_back', 1)
         max_jobs = config['user_settings'].get('max_jobs_to_analyze', 20)
+        incremental = config['user_settings'].get('incremental', False)
+        state_db = config['user_settings'].get('state_db', DEFAULT_DB_FILE)
+
+        stream_jobs = config['user_settings'].get('stream_jobs', False)
+
+        # In incremental mode only entries not analyzed by a previous run go on
+        seen_store = SeenStore(state_db) if incremental else None
+
+        # Drop reposts of the same job under different URLs, across runs too
+        duplicate_detector = None
+        if config['user_settings'].get('near_duplicate_detection', False):
+            duplicate_detector = NearDuplicateDetector(
+                state_db,
+                threshold=config['user_settings'].get('near_duplicate_threshold', 0.8)
+            )
+
+        # Score jobs locally against the profile so only likely matches reach Gemini
+        prefilter = None
+        if config['user_settings'].get('prefilter', False):
+            prefilter = JobPrefilter(user_profile, config['user_preferences'], config['user_settings'])
+
+        content_extractor = ContentExtractor(timeout=15, settings=config['user_settings'])
 
         # Step 1: Parse RSS feeds
-        logger.info("\nStep 1: Parsing RSS feeds...")
-        rss_parser = RSSParser(config['rss_feeds'])
-        jobs = rss_parser.parse_feeds(days_back=days_back)
+        feed_manager = config['feed_manager']
+        state_store = FeedStateStore(default_state_file(feed_manager.config_file))
+        rss_parser = RSSParser(config['rss_feeds'], settings=feed_manager.settings, state_store=state_store)
+
+        if stream_jobs:
+            # Extract jobs as soon as their feed completes, overlapping
+            # page fetches with the remaining feed downloads
+            logger.info("\nStep 1-2: Parsing RSS feeds and extracting content as feeds complete...")
+            job_source = rss_parser.iter_jobs(days_back=days_back)
+        else:
+            logger.info("\nStep 1: Parsing RSS feeds...")
+            job_source = rss_parser.parse_feeds(days_back=days_back)
+
+        jobs = []
+        skipped = {'seen': 0, 'duplicates': 0, 'avoided': 0}
+
+        def accepted_jobs():
+            for job in job_source:
+                if seen_store and not seen_store.check_unseen(job):
+                    skipped['seen'] += 1
+                    continue
+                if duplicate_detector and duplicate_detector.is_duplicate(job):
+                    skipped['duplicates'] += 1
+                    continue
+                # Streamed jobs cannot be ranked before extraction; drop the obvious mismatches
+                if stream_jobs and prefilter and prefilter.avoided_keyword(job, text_field='summary'):
+                    skipped['avoided'] += 1
+                    if seen_store:
+                        seen_store.mark_rejected(job_key(job))
+                    continue
+                jobs.append(job)
+                yield job
+
+        accepted = accepted_jobs()
+        extracted = []
+        if stream_jobs:
+            extracted = content_extractor.extract_many(
+                job['link'] for job in itertools.islice(accepted, max_jobs)  # Limit based on user settings
+            )
+        # Drain the remaining feeds so job counts and feed state are complete
+        for _ in accepted:
+            pass
+
+        if seen_store:
+            logger.info(f"Skipped {skipped['seen']} entries already analyzed in earlier runs")
+        if duplicate_detector:
+            logger.info(f"Skipped {skipped['duplicates']} near-duplicate entries")
+        if skipped['avoided']:
+            logger.info(f"Skipped {skipped['avoided']} entries containing avoided keywords")
         
         if not jobs:
             logger.warning("No jobs found in RSS feeds")
@@ -119,22 +198,46 @@ def main():
                 config['smtp_username'],
                 config['smtp_password']
             )
-            email_sender.send_job_report(config['email_to'], [], 0)
+            if email_sender.send_job_report(config['email_to'], [], 0):
+                rss_parser.commit_state()
             return
         
         logger.info(f"Found {len(jobs)} job postings")
         
         # Step 2: Extract content from job postings
-        logger.info("\nStep 2: Extracting content from job postings...")
-        content_extractor = ContentExtractor(timeout=15)
+        selected = jobs
+        if not stream_jobs and prefilter:
+            # Spend the max_jobs extractions on the entries that look most relevant
+            selected = prefilter.rank_entries(jobs)
+        # Entries past max_jobs_to_analyze are left for the next run
+        cut_off = max(0, len(selected) - max_jobs)
+        if not stream_jobs:
+            selected = selected[:max_jobs]  # Limit based on user settings
+            logger.info("\nStep 2: Extracting content from job postings...")
+            extracted = content_extractor.extract_many([job['link'] for job in selected])
 
         job_contents = []
-        for job in jobs[:max_jobs]:  # Limit based on user settings
-            content = content_extractor.extract_content(job['link'])
+        url_to_key = {}
+        for job, content in zip(selected, extracted):
             if content:
                 job_contents.append(content)
+                url_to_key[content['url']] = job_key(job)
+                if seen_store:
+                    seen_store.mark_extracted(job_key(job))
         
+        content_extractor.close()
         logger.info(f"Successfully extracted content from {len(job_contents)} job postings")
+
+        if duplicate_detector and config['user_settings'].get('near_duplicate_content', False):
+            job_contents = duplicate_detector.filter_jobs(job_contents, text_field='content', key_prefix='content:')
+
+        if prefilter:
+            job_contents = prefilter.filter_jobs(job_contents)
+            cut_off += prefilter.cut_off
+            if seen_store:
+                # Mismatches would be rejected again; don't fetch them next run
+                for job in prefilter.rejected:
+                    seen_store.mark_rejected(url_to_key.get(job.get('url')) or job_key(job))
         
         if not job_contents:
             logger.warning("No content could be extracted from job postings")
@@ -142,8 +245,21 @@ def main():
         
         # Step 3: Analyze jobs with Gemini API
         logger.info("\nStep 3: Analyzing jobs with Gemini API...")
-        job_analyzer = JobAnalyzer(config['gemini_api_key'], config['user_profile'])
+        job_analyzer = JobAnalyzer(
+            config['gemini_api_key'],
+            config['user_profile'],
+            settings=config['user_settings'],
+            cache_mode=config['analysis_cache_mode']
+        )
         analyses = job_analyzer.analyze_multiple_jobs(job_contents)
+        job_analyzer.close()
+
+        if seen_store:
+            # Failed analyses are retried next run
+            for analysis in analyses:
+                if analysis.get('analysis_failed'):
+                    continue
+                seen_store.mark_analyzed(url_to_key.get(analysis['url'], analysis['url']))
         
         logger.info(f"Analyzed {len(analyses)} jobs")
         suitable_jobs = [a for a in analyses if a.get('suitable', False)]
@@ -166,6 +282,10 @@ def main():
         
         if success:
             logger.info("Email report sent successfully!")
+            # Entries cut off by max_jobs_to_analyze or prefilter_max_jobs
+            # must come back next run
+            if not cut_off:
+                rss_parser.commit_state()
         else:
             logger.error("Failed to send email report")
         
@@ -7,6 +7,8 @@ Helps manage RSS feeds in rss_feeds.json
 import sys
 import json
 from feed_config import FeedConfigManager, RSSFeed
+from feed_health import FeedHealthTracker
+from feed_state import FeedStateStore, default_state_file
 
 
 def list_feeds():
@@ -18,6 +20,8 @@ def list_feeds():
         print("No feeds configured.")
         return
     
+    health_tracker = FeedHealthTracker(FeedStateStore(default_state_file(manager.config_file)), manager.settings)
+    
     print(f"\n{'='*80}")
     print(f"{'RSS FEEDS CONFIGURATION':^80}")
     print(f"{'='*80}\n")
@@ -30,6 +34,7 @@ def list_feeds():
         print(f"   Priority: {feed.priority}")
         print(f"   Tags: {', '.join(feed.tags) if feed.tags else 'none'}")
         print(f"   Description: {feed.description or 'N/A'}")
+        print(f"   Health: {format_health(health_tracker.summary(feed.url))}")
         print()
     
     print(f"Total feeds: {len(manager.feeds)}")
@@ -37,6 +42,31 @@ def list_feeds():
     print()
 
 
+def format_health(health: dict) -> str:
+    """Format a feed health summary for display"""
+    if not health.get('latencies_ms') and not health.get('last_error'):
+        return "no data yet"
+    
+    failures = health.get('consecutive_failures', 0)
+    if health.get('open_until'):
+        state = f"⛔ circuit open until {health['open_until']}"
+    elif failures:
+        state = f"⚠️  {failures} consecutive failure(s)"
+    else:
+        state = "✅ OK"
+    
+    parts = [state]
+    if health.get('p50_ms') is not None:
+        parts.append(f"latency p50 {health['p50_ms']}ms / p95 {health['p95_ms']}ms")
+    if health.get('last_success'):
+        parts.append(f"last success {health['last_success']}")
+    
+    text = " | ".join(parts)
+    if health.get('last_error'):
+        text += f"\n   Last error ({health.get('last_error_at', 'unknown')}): {health['last_error']}"
+    return text
+
+
 def add_feed():
     """Add a new feed interactively"""
     manager = FeedConfigManager()
@@ -0,0 +1,259 @@
+"""
+Near-Duplicate Detection Module
+Finds reposted jobs with nearly identical text using MinHash and LSH banding
+"""
+
+import hashlib
+import random
+import re
+import sqlite3
+import struct
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Mersenne prime used for the universal hash family
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Texts with fewer shingles (e.g. a bare job title) say too little to call
+# two postings duplicates
+MIN_SHINGLES = 8
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WORD_RE = re.compile(r'\w+')
+
+
+def _normalize_tokens(text: str) -> List[str]:
+    """Strip HTML tags and split text into lower-case word tokens"""
+    return _WORD_RE.findall(_TAG_RE.sub(' ', text or '').lower())
+
+
+def _shingles(text: str, size: int = 3) -> set:
+    """Build the set of word n-gram shingles for a text"""
+    tokens = _normalize_tokens(text)
+    if len(tokens) < size:
+        return {' '.join(tokens)} if tokens else set()
+    return {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def _stable_hash(value: str) -> int:
+    """32-bit hash that is stable across processes (unlike hash())"""
+    return struct.unpack('<I', hashlib.blake2b(value.encode('utf-8'), digest_size=4).digest())[0]
+
+
+class NearDuplicateDetector:
+    """Detect near-duplicate job texts with a persisted MinHash LSH index"""
+
+    def __init__(self, db_file: Optional[str] = None, num_perm: int = 128, bands: int = 16,
+                 threshold: float = 0.8, max_age_days: int = 30):
+        """
+        Initialize the detector
+
+        Args:
+            db_file: SQLite file for the signature index (None keeps it in memory)
+            num_perm: Number of MinHash permutations per signature
+            bands: Number of LSH bands; num_perm must be divisible by it
+            threshold: Estimated Jaccard similarity at which texts count as duplicates
+            max_age_days: Signatures older than this are dropped from the index
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+
+        # Fixed seed so signatures stay comparable across runs
+        rng = random.Random(1)
+        self._perms = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file or ':memory:', check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS minhash_signatures (
+                key TEXT PRIMARY KEY,
+                signature BLOB NOT NULL,
+                num_perm INTEGER NOT NULL,
+                created_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS minhash_bands (
+                band INTEGER NOT NULL,
+                bucket TEXT NOT NULL,
+                key TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_minhash_bands ON minhash_bands (band, bucket);
+        """)
+        self._prune(max_age_days)
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self.conn.close()
+
+    def signature(self, text: str) -> List[int]:
+        """
+        Compute the MinHash signature of a text
+
+        Args:
+            text: Text (plain or HTML) to sign
+
+        Returns:
+            List of num_perm minimum hash values (empty if the text has no words)
+        """
+        return self._minhash(_shingles(text))
+
+    def _minhash(self, shingles: set) -> List[int]:
+        """Compute the MinHash signature of a shingle set"""
+        hashes = [_stable_hash(s) for s in shingles]
+        if not hashes:
+            return []
+
+        return [
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        ]
+
+    def check(self, key: str, text: str) -> Optional[str]:
+        """
+        Check a text against the index and add it if it is not a duplicate
+
+        Args:
+            key: Identifier of the job (e.g. canonical link)
+            text: Text to compare
+
+        Returns:
+            Key of the earlier near-duplicate, or None if the text is new
+            (or too short to compare)
+        """
+        shingles = _shingles(text)
+        if len(shingles) < MIN_SHINGLES:
+            return None
+        signature = self._minhash(shingles)
+
+        buckets = self._band_buckets(signature)
+
+        with self._lock:
+            candidates = set()
+            for band, bucket in buckets:
+                rows = self.conn.execute(
+                    "SELECT key FROM minhash_bands WHERE band = ? AND bucket = ?", (band, bucket)
+                ).fetchall()
+                candidates.update(row[0] for row in rows if row[0] != key)
+
+            for candidate in sorted(candidates):
+                row = self.conn.execute(
+                    "SELECT signature FROM minhash_signatures WHERE key = ? AND num_perm = ?",
+                    (candidate, self.num_perm)
+                ).fetchone()
+                if row and self._similarity(signature, self._unpack(row[0])) >= self.threshold:
+                    return candidate
+
+            self._add(key, signature, buckets)
+            return None
+
+    def filter_jobs(self, jobs: List[Dict], text_field: Optional[str] = None,
+                    key_prefix: str = '') -> List[Dict]:
+        """
+        Drop jobs whose text nearly duplicates an earlier job
+
+        Args:
+            jobs: Job dictionaries (RSSParser output or extracted contents)
+            text_field: Field holding the text to compare; defaults to
+                title plus summary
+            key_prefix: Prefix for index keys, so different kinds of text
+                (e.g. extracted content) are indexed separately
+
+        Returns:
+            Jobs that are not near-duplicates, in input order
+        """
+        unique = [job for job in jobs if not self.is_duplicate(job, text_field, key_prefix)]
+
+        removed = len(jobs) - len(unique)
+        logger.info(f"Near-duplicate detection: {removed} removed, {len(unique)} remaining")
+        return unique
+
+    def is_duplicate(self, job: Dict, text_field: Optional[str] = None,
+                     key_prefix: str = '') -> bool:
+        """
+        Check one job against the index, adding it if it is new
+
+        Args:
+            job: Job dictionary (RSSParser output or extracted content)
+            text_field: Field holding the text to compare; defaults to
+                title plus summary
+            key_prefix: Prefix for index keys (see filter_jobs)
+
+        Returns:
+            True if the job nearly duplicates an earlier job
+        """
+        key = key_prefix + (job.get('canonical_link') or job.get('link') or job.get('url') or job.get('id', ''))
+        if text_field:
+            text = job.get(text_field, '')
+        else:
+            text = f"{job.get('title', '')}\n{job.get('summary', '')}"
+
+        duplicate_of = self.check(key, text)
+        if duplicate_of:
+            logger.info(f"  Near-duplicate skipped: {job.get('title', 'Unknown')[:60]}")
+            logger.debug(f"    {key} ~ {duplicate_of}")
+            return True
+        return False
+
+    def _band_buckets(self, signature: List[int]) -> List[tuple]:
+        """Split a signature into (band, bucket hash) pairs"""
+        buckets = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(struct.pack(f'<{self.rows}I', *chunk), digest_size=8).hexdigest()
+            buckets.append((band, digest))
+        return buckets
+
+    def _add(self, key: str, signature: List[int], buckets: List[tuple]) -> None:
+        """Store a signature and its band buckets (caller holds the lock)"""
+        self.conn.execute("DELETE FROM minhash_bands WHERE key = ?", (key,))
+        self.conn.execute(
+            "INSERT OR REPLACE INTO minhash_signatures (key, signature, num_perm, created_at) VALUES (?, ?, ?, ?)",
+            (key, self._pack(signature), self.num_perm, datetime.now().isoformat())
+        )
+        self.conn.executemany(
+            "INSERT INTO minhash_bands (band, bucket, key) VALUES (?, ?, ?)",
+            [(band, bucket, key) for band, bucket in buckets]
+        )
+        self.conn.commit()
+
+    def _prune(self, max_age_days: int) -> None:
+        """Remove signatures older than max_age_days"""
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        with self._lock:
+            self.conn.execute(
+                "DELETE FROM minhash_bands WHERE key IN "
+                "(SELECT key FROM minhash_signatures WHERE created_at < ?)", (cutoff,)
+            )
+            self.conn.execute("DELETE FROM minhash_signatures WHERE created_at < ?", (cutoff,))
+            self.conn.commit()
+
+    @staticmethod
+    def _similarity(sig_a: List[int], sig_b: List[int]) -> float:
+        """Estimate Jaccard similarity from two signatures"""
+        if len(sig_a) != len(sig_b) or not sig_a:
+            return 0.0
+        return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+    @staticmethod
+    def _pack(signature: List[int]) -> bytes:
+        """Serialize a signature for storage"""
+        return struct.pack(f'<{len(signature)}I', *signature)
+
+    @staticmethod
+    def _unpack(data: bytes) -> List[int]:
+        """Deserialize a stored signature"""
+        return list(struct.unpack(f'<{len(data) // 4}I', data))
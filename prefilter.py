@@ -0,0 +1,276 @@
+"""
+Job Pre-filter Module
+Scores extracted jobs locally against the user profile so obvious mismatches
+never reach the Gemini API
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Pattern
+from user_config import UserPreferences, UserProfile
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Matched skills at which skill coverage counts as complete
+SKILL_SATURATION = 5
+# Weights of the score components (sum to 1)
+SKILL_WEIGHT = 0.45
+TITLE_WEIGHT = 0.35
+BM25_WEIGHT = 0.20
+
+_TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#]*')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower-case tokens, keeping names like c++ and c#"""
+    return _TOKEN_RE.findall((text or '').lower())
+
+
+def _term_variants(term: str) -> List[str]:
+    """Spellings of a profile term to match, e.g. 'HTML/CSS' -> html, css; 'React.js' -> react"""
+    term = term.strip()
+    variants = {term}
+    if '/' in term:
+        variants.update(part.strip() for part in term.split('/') if part.strip())
+    for variant in list(variants):
+        if variant.lower().endswith('.js'):
+            variants.add(variant[:-3])
+    return sorted(variants, key=len, reverse=True)
+
+
+def compile_terms(terms: List[str]) -> Optional[Pattern]:
+    """
+    Compile terms into one case-insensitive pattern matching whole words
+
+    Args:
+        terms: Keywords or phrases
+
+    Returns:
+        Compiled pattern, or None for an empty list
+    """
+    variants = [re.escape(v) for term in terms if term and term.strip() for v in _term_variants(term)]
+    if not variants:
+        return None
+    return re.compile(r'(?<!\w)(?:' + '|'.join(variants) + r')(?!\w)', re.IGNORECASE)
+
+
+class BM25:
+    """Okapi BM25 over a small in-memory corpus"""
+
+    def __init__(self, documents: List[List[str]], k1: float = 1.5, b: float = 0.75):
+        """
+        Index tokenized documents
+
+        Args:
+            documents: Token lists, one per document
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.term_freqs = [Counter(doc) for doc in documents]
+        self.lengths = [len(doc) for doc in documents]
+        self.avg_length = (sum(self.lengths) / len(documents)) if documents else 0
+        doc_freqs = Counter(term for freqs in self.term_freqs for term in freqs)
+        n = len(documents)
+        self.idf = {term: math.log((n - df + 0.5) / (df + 0.5) + 1) for term, df in doc_freqs.items()}
+
+    def max_score(self, query: List[str]) -> float:
+        """
+        Upper bound of score() for the query tokens
+
+        Approached by a document containing every query term many times, so
+        score() / max_score() is a 0-1 relevance that does not depend on
+        how well the other documents match.
+        """
+        n = len(self.term_freqs)
+        return sum(self.idf.get(term, math.log((n + 0.5) / 0.5 + 1)) * (self.k1 + 1) for term in set(query))
+
+    def score(self, index: int, query: List[str]) -> float:
+        """BM25 score of document `index` for the query tokens"""
+        freqs = self.term_freqs[index]
+        norm = self.k1 * (1 - self.b + self.b * self.lengths[index] / (self.avg_length or 1))
+        total = 0.0
+        for term in set(query):
+            tf = freqs.get(term, 0)
+            if tf:
+                total += self.idf[term] * tf * (self.k1 + 1) / (tf + norm)
+        return total
+
+
+class JobPrefilter:
+    """Keyword rules plus BM25 relevance against the profile, run before JobAnalyzer"""
+
+    def __init__(self, profile: UserProfile, preferences: Optional[UserPreferences] = None,
+                 settings: Optional[Dict] = None):
+        """
+        Initialize the pre-filter
+
+        Args:
+            profile: User profile (skills and job titles)
+            preferences: User preferences (avoid/required/nice-to-have keywords)
+            settings: Optional ``settings`` block from user_profile.json
+        """
+        preferences = preferences or UserPreferences()
+        settings = settings or {}
+        # Jobs scoring below this (0-100) are dropped
+        self.min_score = float(settings.get('prefilter_min_score', 20))
+        # Only the best-scoring jobs up to this many go on (None keeps all)
+        self.max_jobs = settings.get('prefilter_max_jobs')
+
+        self.skills = [skill for skill in profile.skills if skill.strip()]
+        self.skill_patterns = [compile_terms([skill]) for skill in self.skills]
+        self.title_pattern = compile_terms(profile.job_titles)
+        self.title_tokens = [set(tokenize(title)) for title in profile.job_titles if tokenize(title)]
+        self.avoid_pattern = compile_terms(preferences.avoid_keywords)
+        self.required_patterns = [(kw, compile_terms([kw])) for kw in preferences.required_keywords if kw.strip()]
+        self.query = tokenize(' '.join(profile.skills + profile.job_titles + preferences.nice_to_have))
+        # Jobs rejected as mismatches (not worth fetching or analyzing again)
+        self.rejected: List[Dict] = []
+        # Jobs that passed but fell past prefilter_max_jobs
+        self.cut_off = 0
+
+    def avoided_keyword(self, job: Dict, text_field: str = 'content') -> Optional[str]:
+        """
+        Find an avoided keyword in a job
+
+        Args:
+            job: Job dictionary
+            text_field: Field holding the job text
+
+        Returns:
+            The first avoided keyword found, or None
+        """
+        if not self.avoid_pattern:
+            return None
+        match = self.avoid_pattern.search(f"{job.get('title', '')}\n{job.get(text_field) or ''}")
+        return match.group(0) if match else None
+
+    def rejection_reason(self, job: Dict) -> Optional[str]:
+        """
+        Check a job against the avoid and required keyword rules
+
+        Args:
+            job: Job content dictionary (title and content)
+
+        Returns:
+            Why the job is rejected, or None if it passes
+        """
+        text = f"{job.get('title', '')}\n{job.get('content', '')}"
+        avoided = self.avoided_keyword(job)
+        if avoided:
+            return f"contains avoided keyword '{avoided}'"
+        for keyword, pattern in self.required_patterns:
+            if not pattern.search(text):
+                return f"missing required keyword '{keyword}'"
+        return None
+
+    def title_match(self, title: str) -> float:
+        """Score (0-1) of how well a job title matches the wanted titles"""
+        if self.title_pattern and self.title_pattern.search(title or ''):
+            return 1.0
+        tokens = set(tokenize(title))
+        return max((len(tokens & wanted) / len(wanted) for wanted in self.title_tokens), default=0.0)
+
+    def score_jobs(self, jobs: List[Dict], text_field: str = 'content') -> List[float]:
+        """
+        Score jobs against the profile
+
+        The score (0-100) combines skill coverage, job title match and BM25
+        relevance of the whole text to the profile terms. Relevance is
+        relative to the best possible BM25 score, not to the other jobs,
+        and jobs matching neither a skill nor a wanted title score 0.
+
+        Args:
+            jobs: Job dictionaries
+            text_field: Field holding the job text
+
+        Returns:
+            Scores aligned with the input
+        """
+        texts = [f"{job.get('title', '')}\n{job.get(text_field) or ''}" for job in jobs]
+        bm25 = BM25([tokenize(text) for text in texts])
+        best = bm25.max_score(self.query) or 1
+
+        scores = []
+        for i, (job, text) in enumerate(zip(jobs, texts)):
+            matched = sum(1 for pattern in self.skill_patterns if pattern and pattern.search(text))
+            title = self.title_match(job.get('title', ''))
+            if not matched and not title:
+                scores.append(0.0)
+                continue
+            skill_coverage = min(1.0, matched / min(SKILL_SATURATION, len(self.skills))) if self.skills else 0.0
+            score = (SKILL_WEIGHT * skill_coverage
+                     + TITLE_WEIGHT * title
+                     + BM25_WEIGHT * min(1.0, bm25.score(i, self.query) / best))
+            scores.append(round(score * 100, 1))
+        return scores
+
+    def rank_entries(self, entries: List[Dict]) -> List[Dict]:
+        """
+        Rank feed entries by their title and summary, before any page is fetched
+
+        Entries with an avoided keyword are dropped (and added to
+        self.rejected); the required keywords and minimum score are left to
+        filter_jobs, since a summary is too short to judge them.
+
+        Args:
+            entries: Job dictionaries from RSSParser
+
+        Returns:
+            Remaining entries, best first
+        """
+        kept = []
+        for entry in entries:
+            avoided = self.avoided_keyword(entry, text_field='summary')
+            if avoided:
+                logger.info(f"  Pre-filter dropped: {entry.get('title', 'Unknown')[:60]} "
+                            f"(contains avoided keyword '{avoided}')")
+                self.rejected.append(entry)
+            else:
+                kept.append(entry)
+        scores = self.score_jobs(kept, text_field='summary')
+        order = sorted(range(len(kept)), key=lambda i: scores[i], reverse=True)
+        return [kept[i] for i in order]
+
+    def filter_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Drop mismatching jobs and rank the rest by local score
+
+        Rejected jobs are added to self.rejected; jobs that pass but fall
+        past prefilter_max_jobs are only counted in self.cut_off, since
+        they are still worth analyzing in a later run.
+
+        Args:
+            jobs: Job content dictionaries from ContentExtractor
+
+        Returns:
+            Passing jobs, best first, each with a 'prefilter_score' key
+        """
+        passed = []
+        for job in jobs:
+            reason = self.rejection_reason(job)
+            if reason:
+                logger.info(f"  Pre-filter dropped: {job.get('title', 'Unknown')[:60]} ({reason})")
+                self.rejected.append(job)
+            else:
+                passed.append(job)
+
+        ranked = []
+        for job, score in zip(passed, self.score_jobs(passed)):
+            if score < self.min_score:
+                logger.info(f"  Pre-filter dropped: {job.get('title', 'Unknown')[:60]} (score {score:.0f})")
+                self.rejected.append(job)
+                continue
+            ranked.append({**job, 'prefilter_score': score})
+        ranked.sort(key=lambda job: job['prefilter_score'], reverse=True)
+
+        if self.max_jobs is not None and len(ranked) > int(self.max_jobs):
+            self.cut_off += len(ranked) - int(self.max_jobs)
+            ranked = ranked[:int(self.max_jobs)]
+
+        logger.info(f"Pre-filter: {len(ranked)} of {len(jobs)} jobs go on to analysis")
+        return ranked
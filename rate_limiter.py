@@ -0,0 +1,261 @@
+"""
+Rate Limiter Module
+Per-host token buckets that pace requests and back off on Retry-After, and
+the process pools that take parsing off the request threads
+"""
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Create a process pool for CPU-bound parsing
+
+    Worker processes come from a fork server (spawn where there is none):
+    forking the threaded parent could copy locks held by other threads.
+
+    Args:
+        max_workers: Number of worker processes
+
+    Returns:
+        New process pool
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+
+class RateLimited(Exception):
+    """Raised when a server answers 429/503, after its host has been throttled"""
+
+    def __init__(self, host: str, delay: float):
+        """
+        Args:
+            host: Host that asked us to slow down
+            delay: Seconds until requests to the host may resume
+        """
+        super().__init__(f"{host} rate limited us for {delay:.0f}s")
+        self.host = host
+        self.delay = delay
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+        now: Current time (default: datetime.now(timezone.utc))
+
+    Returns:
+        Delay in seconds (never negative), or None if missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+class TokenBucket:
+    """Token bucket allowing bursts of `burst` requests at `rate` per second on average"""
+
+    def __init__(self, rate: float, burst: float):
+        """
+        Initialize a full bucket
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+        """
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        # Set from Retry-After; no tokens are handed out before this time
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update; none are earned while blocked"""
+        earned_from = max(self.updated, self.blocked_until)
+        if now > earned_from:
+            self.tokens = min(self.burst, self.tokens + (now - earned_from) * self.rate)
+        self.updated = now
+
+    def ready_in(self, now: float, tokens: float = 1) -> float:
+        """Seconds until `tokens` tokens are available (0 if available now)"""
+        self._refill(now)
+        blocked = max(0.0, self.blocked_until - now)
+        missing = tokens - self.tokens
+        if missing <= 0:
+            return blocked
+        if self.rate <= 0:
+            return float('inf')
+        return blocked + missing / self.rate
+
+    def take(self, tokens: float = 1) -> None:
+        """Consume tokens (callers check ready_in first)"""
+        self.tokens -= tokens
+
+
+class HostRateLimiter:
+    """Token bucket per host, with per-host overrides and Retry-After backoff"""
+
+    def __init__(self, settings: Optional[Dict] = None):
+        """
+        Initialize the limiter
+
+        Args:
+            settings: Optional ``settings`` block from user_profile.json
+        """
+        settings = settings or {}
+        self.default_rate = float(settings.get('host_rate_limit', 1.0))
+        self.default_burst = float(settings.get('host_rate_burst', 3))
+        # Host (or parent domain) -> {'rate': ..., 'burst': ...}
+        self.overrides: Dict[str, Dict] = {
+            host.lower(): limits for host, limits in (settings.get('host_rate_limits') or {}).items()
+        }
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _limits(self, host: str) -> tuple:
+        """Find the (rate, burst) for a host, matching overrides by domain suffix"""
+        parts = host.split('.')
+        for i in range(len(parts)):
+            limits = self.overrides.get('.'.join(parts[i:]))
+            if limits:
+                return (float(limits.get('rate', self.default_rate)),
+                        float(limits.get('burst', self.default_burst)))
+        return self.default_rate, self.default_burst
+
+    def _bucket(self, host: str) -> TokenBucket:
+        """Get or create the bucket of a host (caller holds the lock)"""
+        host = (host or '').lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(*self._limits(host))
+        return bucket
+
+    def ready_in(self, host: str) -> float:
+        """
+        Check how long a request to a host would have to wait, without taking a token
+
+        Args:
+            host: Host name
+
+        Returns:
+            Seconds until a request may be sent (0 if it may be sent now)
+        """
+        with self._lock:
+            return self._bucket(host).ready_in(time.monotonic())
+
+    def acquire(self, host: str) -> None:
+        """
+        Block until a request to a host is allowed, then take a token
+
+        Args:
+            host: Host name
+        """
+        while True:
+            with self._lock:
+                bucket = self._bucket(host)
+                wait = bucket.ready_in(time.monotonic())
+                if wait <= 0:
+                    bucket.take()
+                    return
+            time.sleep(min(wait, 1.0))
+
+    def throttle(self, host: str, delay: float) -> None:
+        """
+        Hold back all requests to a host for a number of seconds
+
+        Args:
+            host: Host name
+            delay: Seconds to wait (e.g. from a Retry-After header)
+        """
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+            # Resume with a single request rather than a burst
+            bucket.tokens = min(bucket.tokens, 1.0)
+        logger.warning(f"Throttling {host} for {delay:.0f}s")
+
+
+class QuotaLimiter:
+    """Requests-per-minute and tokens-per-minute budget shared by worker threads"""
+
+    def __init__(self, requests_per_minute: Optional[float] = None,
+                 tokens_per_minute: Optional[float] = None):
+        """
+        Initialize the limiter
+
+        Both budgets are token buckets refilled continuously, allowing
+        bursts of up to ten seconds' worth of quota. A budget of None (or 0)
+        is not limited.
+
+        Args:
+            requests_per_minute: Maximum requests per minute
+            tokens_per_minute: Maximum (estimated) tokens per minute
+        """
+        self._buckets = {}
+        if requests_per_minute:
+            self._buckets['requests'] = TokenBucket(requests_per_minute / 60, requests_per_minute / 6)
+        if tokens_per_minute:
+            self._buckets['tokens'] = TokenBucket(tokens_per_minute / 60, tokens_per_minute / 6)
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 0) -> None:
+        """
+        Block until one request using `tokens` tokens fits both budgets, then spend them
+
+        Args:
+            tokens: Estimated tokens of the request (prompt plus response)
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                needed = {'requests': 1}
+                if 'tokens' in self._buckets:
+                    # A request larger than the burst would never fit; let it drain the bucket instead
+                    needed['tokens'] = min(tokens, self._buckets['tokens'].burst)
+                needed = {name: amount for name, amount in needed.items() if name in self._buckets}
+
+                wait = max((self._buckets[name].ready_in(now, amount) for name, amount in needed.items()),
+                           default=0.0)
+                if wait <= 0:
+                    for name, amount in needed.items():
+                        self._buckets[name].take(amount)
+                    return
+            time.sleep(min(wait, 1.0))
+
+    def pause(self, delay: float) -> None:
+        """
+        Hold back all requests for a number of seconds (e.g. after a quota error)
+
+        Args:
+            delay: Seconds to wait
+        """
+        with self._lock:
+            for bucket in self._buckets.values():
+                bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+            # Resume with a single request rather than a burst
+            if 'requests' in self._buckets:
+                self._buckets['requests'].tokens = min(self._buckets['requests'].tokens, 1.0)
+        logger.warning(f"Pausing requests for {delay:.0f}s")
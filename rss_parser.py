@@ -3,25 +3,112 @@ RSS Feed Parser Module
 Parses RSS feeds and extracts job posting URLs
 """
 
+import socket
+import threading
+import time
 import feedparser
-from typing import List, Dict
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator, List, Dict, Optional
 from datetime import datetime, timedelta
+from feed_health import FeedHealthTracker
+from feed_scheduler import FeedScheduler
+from feed_state import FeedStateStore
+from feed_stream import BoundedReader, parse_ordered_feed
+from rate_limiter import process_pool
+from url_utils import canonicalize_url, dedup_key
 from logger import get_logger, log_job_summary, log_section, log_total_summary
 
 logger = get_logger(__name__)
 
 
+def parse_feed_content(content, response_headers: Optional[Dict] = None) -> Dict:
+    """
+    Parse raw feed bytes into plain, picklable data
+
+    Runs in a worker process when a parse pool is configured, so only the
+    fields the parser needs are returned.
+
+    Args:
+        content: Feed body bytes (or a local path)
+        response_headers: HTTP response headers, used for encoding detection
+
+    Returns:
+        Dictionary with 'bozo', 'bozo_exception' and a list of 'entries'
+    """
+    feed = feedparser.parse(content, response_headers=response_headers or {})
+    fields = ('id', 'title', 'link', 'summary', 'published_parsed', 'updated_parsed')
+
+    entries = []
+    for entry in feed.entries:
+        parsed = {name: tuple(entry[name]) if name.endswith('_parsed') and entry[name] else entry[name]
+                  for name in fields if name in entry}
+        # Atom feeds (e.g. Google Alerts) carry the entry body in <content>
+        # rather than <summary>; use it, as feed_stream._atom_entry does
+        if entry.get('content') and not parsed.get('summary'):
+            parsed['summary'] = entry['content'][0].get('value', '')
+        entries.append(parsed)
+
+    return {
+        'bozo': bool(feed.get('bozo')),
+        'bozo_exception': str(feed.get('bozo_exception')) if feed.get('bozo') else None,
+        'entries': entries
+    }
+
+
+def _abort_response(response) -> None:
+    """Shut down the socket of a streamed response so a blocked read returns at once"""
+    try:
+        response.raw.connection.sock.shutdown(socket.SHUT_RDWR)
+    except (AttributeError, OSError):
+        pass
+
+
 class RSSParser:
     """Parse RSS feeds and extract job posting information"""
 
-    def __init__(self, feeds):
+    def __init__(self, feeds, settings: Optional[Dict] = None,
+                 state_store: Optional[FeedStateStore] = None):
         """
         Initialize RSS parser with feed URLs or RSSFeed objects
 
         Args:
             feeds: List of RSS feed URLs (strings) or RSSFeed objects to parse
+            settings: Optional ``settings`` block from rss_feeds.json
+            state_store: Optional store used to persist per-feed state between runs
         """
         self.feeds = feeds
+        self.settings = settings or {}
+        self.state_store = state_store
+        # Number of feeds fetched in parallel; 1 keeps the sequential behaviour
+        self.max_workers = max(1, int(self.settings.get('max_concurrent_feeds', 1)))
+        # Send ETag / Last-Modified validators so unchanged feeds return 304
+        self.conditional_get = bool(self.settings.get('conditional_get', True)) and state_store is not None
+        # Validators and schedules from this run, stored by commit_state() once its entries have been handled
+        self._pending_validators: Dict[str, Dict] = {}
+        self._scheduler: Optional[FeedScheduler] = None
+        # Skip feeds that are not due according to their historical yield
+        self.adaptive_scheduling = bool(self.settings.get('adaptive_scheduling', False)) and state_store is not None
+        # Track failures and latency; skip feeds that keep failing for a growing window
+        self.health = None
+        if self.settings.get('circuit_breaker', True) and state_store is not None:
+            self.health = FeedHealthTracker(state_store, self.settings)
+        self.feed_stats: Dict[str, Dict] = {}
+
+        # Raw bytes are fetched through one pooled session with explicit limits
+        self.connect_timeout = float(self.settings.get('feed_connect_timeout', 5))
+        self.fetch_timeout = float(self.settings.get('feed_timeout', 20))
+        self.max_feed_bytes = int(self.settings.get('feed_max_bytes', 5 * 1024 * 1024))
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'Mozilla/5.0 (compatible; jobcrawler RSS reader)'
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # CPU-bound feed parsing is moved to worker processes when configured
+        self.parse_processes = int(self.settings.get('feed_parse_processes', 0))
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
 
     def parse_feeds(self, days_back: int = 1) -> List[Dict]:
         """
@@ -33,75 +120,441 @@ class RSSParser:
         Returns:
             List of job posting dictionaries with title, link, published date
         """
-        all_jobs = []
+        # Network fetches may run concurrently, but results are consumed in
+        # feed order so logging, feed_stats and job order stay deterministic
+        return list(self._run(days_back, ordered=True))
+
+    def iter_jobs(self, days_back: int = 1) -> Iterator[Dict]:
+        """
+        Parse all RSS feeds, yielding job postings as each feed completes
+
+        Unlike parse_feeds, jobs arrive in feed completion order, so callers
+        can start working on them while slower feeds are still downloading.
+        The same per-feed and final summary logging is produced.
+
+        Args:
+            days_back: Number of days to look back for job postings
+
+        Yields:
+            Job posting dictionaries with title, link, published date
+        """
+        return self._run(days_back, ordered=False)
+
+    def _run(self, days_back: int, ordered: bool) -> Iterator[Dict]:
+        """
+        Fetch and process all feeds, yielding deduplicated jobs
+
+        Args:
+            days_back: Number of days to look back for job postings
+            ordered: Process feeds in configured order (True) or as they complete
+
+        Yields:
+            Job posting dictionaries
+        """
         cutoff_date = datetime.now() - timedelta(days=days_back)
         feed_stats = {}  # Track jobs per feed
+        self.feed_stats = feed_stats
+        seen_links: Dict[str, Dict] = {}
+        total_jobs = 0
+        duplicates = 0
 
         log_section(logger, "RSS FEED PARSING")
         logger.info(f"Parsing {len(self.feeds)} RSS feeds (looking back {days_back} day(s))")
         logger.info(f"Cutoff date: {cutoff_date.strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info("")
 
-        for feed_idx, feed_item in enumerate(self.feeds, 1):
-            try:
-                # Handle both RSSFeed objects and plain URL strings
-                if hasattr(feed_item, 'url'):
-                    feed_url = feed_item.url
-                    feed_name = getattr(feed_item, 'name', feed_url)
-                else:
-                    feed_url = feed_item
-                    feed_name = feed_url
+        if self.max_workers > 1:
+            logger.info(f"Fetching feeds concurrently ({self.max_workers} workers)")
+            logger.info("")
 
-                logger.info(f"[Feed {feed_idx}/{len(self.feeds)}] Processing: {feed_name}")
+        feeds = self.feeds
+        scheduler = None
+        if self.adaptive_scheduling:
+            # Never wait longer than the look-back window, or entries could be missed
+            scheduler = FeedScheduler(self.state_store, self.settings, max_interval_hours=days_back * 24)
+            self._scheduler = scheduler
+            feeds = self._select_due_feeds(scheduler)
+
+        if self.health:
+            feeds = self._select_healthy_feeds(feeds)
+
+        if self.parse_processes > 0 and feeds:
+            self._parse_pool = process_pool(self.parse_processes)
+
+        try:
+            for position, (feed_idx, feed) in enumerate(self._iter_fetched(feeds, ordered, cutoff_date), 1):
+                feed_url, feed_name = self._feed_identity(feeds[feed_idx])
+                logger.info(f"[Feed {position}/{len(feeds)}] Processing: {feed_name}")
                 logger.info(f"  URL: {feed_url}")
 
-                feed = feedparser.parse(feed_url)
-
-                if feed.bozo:
-                    logger.warning(f"  ⚠ Feed parsing warning: {feed.bozo_exception}")
-
-                feed_job_count = 0
-                total_entries = len(feed.entries)
-                logger.info(f"  Total entries in feed: {total_entries}")
-
-                for entry_idx, entry in enumerate(feed.entries, 1):
-                    job_data = self._extract_job_data(entry, cutoff_date, feed_name)
-                    if job_data:
-                        all_jobs.append(job_data)
-                        feed_job_count += 1
-                        logger.info(f"    [{entry_idx}] ✓ Job: {job_data['title'][:60]}{'...' if len(job_data['title']) > 60 else ''}")
-                        logger.debug(f"        Link: {job_data['link']}")
-                        logger.debug(f"        Published: {job_data['published']}")
-                    else:
-                        # Log skipped entries at debug level
-                        entry_title = entry.get('title', 'No Title')[:40]
-                        logger.debug(f"    [{entry_idx}] ✗ Skipped (too old): {entry_title}...")
-
-                feed_stats[feed_name] = {
-                    'total_entries': total_entries,
-                    'jobs_found': feed_job_count,
-                    'url': feed_url
+                feed_jobs, feed_stats[feed_name] = self._process_feed(feed, feed_url, feed_name, cutoff_date)
+                if scheduler:
+                    feed_stats[feed_name]['new_entries'] = scheduler.record(feed_url, feed_stats[feed_name], feed_jobs)
+
+                # Merge postings already emitted by another feed instead of repeating them
+                for job in feed_jobs:
+                    key = dedup_key(job['canonical_link']) if job.get('canonical_link') else None
+                    existing = seen_links.get(key) if key else None
+                    if existing is not None:
+                        if feed_name not in existing['source_feeds']:
+                            existing['source_feeds'].append(feed_name)
+                            existing['source_feed'] = ', '.join(existing['source_feeds'])
+                        duplicates += 1
+                        continue
+
+                    if key:
+                        seen_links[key] = job
+                    total_jobs += 1
+                    yield job
+        finally:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(cancel_futures=True)
+                self._parse_pool = None
+
+        if duplicates:
+            logger.info(f"Removed {duplicates} duplicate job(s) shared across feeds")
+
+        self._log_summary(total_jobs)
+
+        if self.state_store is not None:
+            self.state_store.save()
+
+    def commit_state(self) -> None:
+        """
+        Store the ETag / Last-Modified validators and polling schedules of this run
+
+        Call once every job from the feeds has been handled (e.g. after the
+        report is sent). Until then the previous validators and schedules
+        stay in place, so a failed run fetches the same entries again next
+        time.
+        """
+        if self.state_store is None:
+            return
+        for feed_url, validators in self._pending_validators.items():
+            self.state_store.update(feed_url, 'http', validators)
+        self._pending_validators = {}
+        if self._scheduler:
+            self._scheduler.commit()
+        self.state_store.save()
+
+    def _select_due_feeds(self, scheduler: FeedScheduler) -> List:
+        """
+        Filter feeds down to those the scheduler considers due
+
+        Args:
+            scheduler: Scheduler holding each feed's polling history
+
+        Returns:
+            Due feeds, in configured order
+        """
+        due = []
+        for feed_item in self.feeds:
+            feed_url, feed_name = self._feed_identity(feed_item)
+            if scheduler.is_due(feed_url):
+                due.append(feed_item)
+            else:
+                self.feed_stats[feed_name] = {
+                    'total_entries': 0,
+                    'jobs_found': 0,
+                    'url': feed_url,
+                    'next_due': scheduler.next_due(feed_url)
                 }
 
-                logger.info(f"  Summary: {feed_job_count} jobs found from {total_entries} entries")
-                logger.info("")
+        logger.info(f"Adaptive scheduling: {len(due)} of {len(self.feeds)} feeds due this run")
+        logger.info("")
+        return due
 
-            except Exception as e:
-                logger.error(f"  ✗ Error parsing feed {feed_name}: {str(e)}")
-                feed_stats[feed_name] = {'total_entries': 0, 'jobs_found': 0, 'url': feed_url, 'error': str(e)}
+    def _select_healthy_feeds(self, feeds: List) -> List:
+        """
+        Filter out feeds whose circuit breaker is open
+
+        Args:
+            feeds: Candidate feeds
+
+        Returns:
+            Feeds that may be fetched this run, in the given order
+        """
+        healthy = []
+        for feed_item in feeds:
+            feed_url, feed_name = self._feed_identity(feed_item)
+            if self.health.allow(feed_url):
+                healthy.append(feed_item)
                 continue
 
-        # Log final summary
+            health = self.health.summary(feed_url)
+            self.feed_stats[feed_name] = {
+                'total_entries': 0,
+                'jobs_found': 0,
+                'url': feed_url,
+                'circuit_open_until': health.get('open_until'),
+                'consecutive_failures': health.get('consecutive_failures', 0)
+            }
+
+        if len(healthy) < len(feeds):
+            logger.info(f"Circuit breaker: skipping {len(feeds) - len(healthy)} failing feed(s)")
+            logger.info("")
+        return healthy
+
+    def _process_feed(self, feed, feed_url: str, feed_name: str, cutoff_date: datetime) -> tuple:
+        """
+        Extract jobs from one fetched feed, isolating any error to this feed
+
+        Args:
+            feed: Parsed feed dictionary, or the exception raised while fetching it
+            feed_url: Feed URL
+            feed_name: Feed display name
+            cutoff_date: Only include jobs published after this date
+
+        Returns:
+            Tuple of (list of job dictionaries, feed stats dictionary)
+        """
+        feed_jobs = []
+        try:
+            if isinstance(feed, Exception):
+                raise feed
+
+            if self.conditional_get and feed.get('status') == 304:
+                logger.info("  Not modified since last run (cache hit), skipping")
+                logger.info("")
+                return feed_jobs, {
+                    'total_entries': 0,
+                    'jobs_found': 0,
+                    'url': feed_url,
+                    'cache': 'hit'
+                }
+
+            if feed['bozo']:
+                logger.warning(f"  ⚠ Feed parsing warning: {feed['bozo_exception']}")
+
+            total_entries = len(feed['entries'])
+            logger.info(f"  Total entries in feed: {total_entries}")
+            if feed.get('truncated'):
+                logger.info("  Ordered feed: stopped reading at the first entry older than the cutoff")
+
+            for entry_idx, entry in enumerate(feed['entries'], 1):
+                job_data = self._extract_job_data(entry, cutoff_date, feed_name)
+                if job_data:
+                    feed_jobs.append(job_data)
+                    logger.info(f"    [{entry_idx}] ✓ Job: {job_data['title'][:60]}{'...' if len(job_data['title']) > 60 else ''}")
+                    logger.debug(f"        Link: {job_data['link']}")
+                    logger.debug(f"        Published: {job_data['published']}")
+                else:
+                    # Log skipped entries at debug level
+                    entry_title = entry.get('title', 'No Title')[:40]
+                    logger.debug(f"    [{entry_idx}] ✗ Skipped (too old): {entry_title}...")
+
+            stats = {
+                'total_entries': total_entries,
+                'jobs_found': len(feed_jobs),
+                'url': feed_url
+            }
+            if self.conditional_get:
+                stats['cache'] = 'miss'
+
+            logger.info(f"  Summary: {len(feed_jobs)} jobs found from {total_entries} entries")
+            logger.info("")
+            return feed_jobs, stats
+
+        except Exception as e:
+            logger.error(f"  ✗ Error parsing feed {feed_name}: {str(e)}")
+            return [], {'total_entries': 0, 'jobs_found': 0, 'url': feed_url, 'error': str(e)}
+
+    def _log_summary(self, total_jobs: int) -> None:
+        """Log the per-feed summary in configured feed order"""
         log_section(logger, "FEED PARSING SUMMARY")
-        for feed_name, stats in feed_stats.items():
+        for feed_item in self.feeds:
+            feed_name = self._feed_identity(feed_item)[1]
+            stats = self.feed_stats.get(feed_name)
+            if stats is None:
+                continue
             if 'error' in stats:
                 logger.info(f"  ✗ {feed_name}: ERROR - {stats['error']}")
+            elif 'circuit_open_until' in stats:
+                logger.info(f"  ⛔ {feed_name}: skipped after {stats['consecutive_failures']} consecutive failures "
+                            f"(retry after {stats['circuit_open_until']})")
+            elif 'next_due' in stats:
+                logger.info(f"  ⏸ {feed_name}: not due until {stats['next_due']}")
+            elif stats.get('cache') == 'hit':
+                logger.info(f"  ✓ {feed_name}: not modified (cache hit)")
             else:
-                logger.info(f"  ✓ {feed_name}: {stats['jobs_found']} jobs from {stats['total_entries']} entries")
+                cache_note = " (cache miss)" if stats.get('cache') == 'miss' else ""
+                logger.info(f"  ✓ {feed_name}: {stats['jobs_found']} jobs from {stats['total_entries']} entries{cache_note}")
+
+        if self.conditional_get:
+            hits = sum(1 for stats in self.feed_stats.values() if stats.get('cache') == 'hit')
+            misses = sum(1 for stats in self.feed_stats.values() if stats.get('cache') == 'miss')
+            logger.info(f"  Conditional GET: {hits} cache hits, {misses} cache misses")
+
+        log_total_summary(logger, total_jobs, len(self.feeds))
+
+    @staticmethod
+    def _feed_identity(feed_item) -> tuple:
+        """Return (url, name) for an RSSFeed object or a plain URL string"""
+        if hasattr(feed_item, 'url'):
+            return feed_item.url, getattr(feed_item, 'name', feed_item.url)
+        return feed_item, feed_item
+
+    def _fetch_feed(self, feed_url: str, ordered_cutoff: Optional[datetime] = None) -> Dict:
+        """
+        Download a single feed's bytes and parse them
+
+        When conditional GET is enabled, the ETag / Last-Modified values from
+        the previous run are sent back and the new ones are stored.
+
+        Args:
+            feed_url: Feed URL (or local path, which feedparser reads directly)
+            ordered_cutoff: For feeds marked ``ordered`` (newest first), the
+                cutoff date; the body is then parsed while it streams in and
+                reading stops at the first older entry
+
+        Returns:
+            Parsed feed dictionary (see parse_feed_content) with an HTTP 'status'
+        """
+        if not feed_url.startswith(('http://', 'https://')):
+            if ordered_cutoff is not None:
+                return parse_ordered_feed(feed_url, ordered_cutoff)
+            return self._parse_content(feed_url, {})
+
+        headers = {}
+        validators = self.state_store.get(feed_url, 'http') if self.conditional_get else {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('modified'):
+            headers['If-Modified-Since'] = validators['modified']
+
+        if ordered_cutoff is not None:
+            status, feed, response_headers = self._download(
+                feed_url, headers, consume=lambda reader: parse_ordered_feed(reader, ordered_cutoff)
+            )
+        else:
+            status, content, response_headers = self._download(feed_url, headers)
+            feed = None
+
+        if status == 304:
+            return {'status': 304, 'bozo': False, 'bozo_exception': None, 'entries': []}
+
+        if feed is None:
+            # feedparser expects lower-case header names
+            parse_headers = {name.lower(): value for name, value in response_headers.items()}
+            parse_headers.setdefault('content-location', feed_url)
+            feed = self._parse_content(content, parse_headers)
+        feed['status'] = status
+
+        if self.conditional_get:
+            # Kept back until commit_state(): if the run fails later, the next
+            # run must not get a 304 and lose these entries
+            self._pending_validators[feed_url] = {
+                'etag': response_headers.get('ETag'),
+                'modified': response_headers.get('Last-Modified')
+            }
+
+        return feed
+
+    def _download(self, feed_url: str, headers: Dict, consume: Optional[Callable] = None) -> tuple:
+        """
+        Fetch raw feed bytes through the pooled session
+
+        The body is streamed so the size cap is enforced while reading. A
+        watchdog shuts the connection down when the feed_timeout deadline
+        passes, so a server that trickles data cannot hold a read open.
+
+        Args:
+            feed_url: Feed URL
+            headers: Extra request headers (conditional GET validators)
+            consume: Optional callable that reads the body from a file-like
+                BoundedReader; its result replaces the body bytes and it may
+                stop reading early
+
+        Returns:
+            Tuple of (HTTP status code, body bytes or consume() result, response headers)
+
+        Raises:
+            requests.exceptions.RequestException: On HTTP or network errors
+            ValueError: If the body exceeds feed_max_bytes
+            TimeoutError: If the download exceeds the feed_timeout deadline
+        """
+        deadline = time.monotonic() + self.fetch_timeout
+        with self.session.get(feed_url, headers=headers, timeout=(self.connect_timeout, self.fetch_timeout),
+                              stream=True) as response:
+            if response.status_code == 304:
+                return 304, b'', dict(response.headers)
+            response.raise_for_status()
+
+            declared = response.headers.get('Content-Length')
+            if declared and declared.isdigit() and int(declared) > self.max_feed_bytes:
+                raise ValueError(f"Feed is {declared} bytes, over the {self.max_feed_bytes} byte limit")
+
+            reader = BoundedReader(
+                response.iter_content(chunk_size=64 * 1024), self.max_feed_bytes, deadline, self.fetch_timeout
+            )
+            watchdog = threading.Timer(max(0.0, deadline - time.monotonic()), _abort_response, (response,))
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                body = consume(reader) if consume else reader.read()
+            except Exception:
+                # The watchdog's shutdown surfaces as a connection error mid-read
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Feed download exceeded {self.fetch_timeout}s") from None
+                raise
+            finally:
+                watchdog.cancel()
+            return response.status_code, body, dict(response.headers)
+
+    def _parse_content(self, content, response_headers: Dict) -> Dict:
+        """Parse feed content, in the process pool when one is running"""
+        if self._parse_pool is None:
+            return parse_feed_content(content, response_headers)
+        return self._parse_pool.submit(parse_feed_content, content, response_headers).result()
+
+    def _iter_fetched(self, feeds: List, ordered: bool = True,
+                      cutoff_date: Optional[datetime] = None) -> Iterator[tuple]:
+        """
+        Fetch all feeds, concurrently when max_workers > 1
+
+        Args:
+            feeds: RSSFeed objects or feed URLs to fetch
+            ordered: Yield results in feeds order (True) or as they complete
+            cutoff_date: Cutoff used to stop early on feeds marked ``ordered``
+
+        Yields:
+            Tuples of (index into feeds, parsed feed or the exception
+            raised while fetching it)
+        """
+        def record_health(feed_url: str, started: float, error: Optional[Exception] = None) -> None:
+            # Health bookkeeping must never take down the run
+            try:
+                if error is not None:
+                    self.health.record_failure(feed_url, str(error), time.monotonic() - started)
+                else:
+                    self.health.record_success(feed_url, time.monotonic() - started)
+            except Exception as e:
+                logger.error(f"Could not record health of {feed_url}: {str(e)}")
+
+        def fetch(feed_item):
+            feed_url = self._feed_identity(feed_item)[0]
+            started = time.monotonic()
+            try:
+                ordered_cutoff = cutoff_date if getattr(feed_item, 'ordered', False) else None
+                feed = self._fetch_feed(feed_url, ordered_cutoff)
+            except Exception as e:
+                if self.health:
+                    record_health(feed_url, started, e)
+                return e
+
+            if self.health:
+                record_health(feed_url, started)
+            return feed
 
-        log_total_summary(logger, len(all_jobs), len(self.feeds))
+        if self.max_workers == 1 or len(feeds) <= 1:
+            for idx, feed_item in enumerate(feeds):
+                yield idx, fetch(feed_item)
+            return
 
-        return all_jobs
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(feeds))) as executor:
+            futures = {executor.submit(fetch, feed_item): idx for idx, feed_item in enumerate(feeds)}
+            for future in (futures if ordered else as_completed(futures)):
+                yield futures[future], future.result()
 
     def _extract_job_data(self, entry, cutoff_date: datetime, feed_name: str = 'Unknown') -> Dict:
         """
@@ -118,21 +571,27 @@ class RSSParser:
         try:
             # Extract published date
             published = None
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                published = datetime(*entry.published_parsed[:6])
-            elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                published = datetime(*entry.updated_parsed[:6])
+            if entry.get('published_parsed'):
+                published = datetime(*entry['published_parsed'][:6])
+            elif entry.get('updated_parsed'):
+                published = datetime(*entry['updated_parsed'][:6])
 
             # Skip if too old
             if published and published < cutoff_date:
                 return None
 
+            # The link is fetched as published; the canonical form only
+            # identifies the posting (dedup, seen store)
+            link = (entry.get('link') or '').strip()
             job_data = {
+                'id': entry.get('id', ''),
                 'title': entry.get('title', 'No Title'),
-                'link': entry.get('link', ''),
+                'link': link,
+                'canonical_link': canonicalize_url(link),
                 'published': published.isoformat() if published else None,
                 'summary': entry.get('summary', ''),
-                'source_feed': feed_name
+                'source_feed': feed_name,
+                'source_feeds': [feed_name]
             }
 
             return job_data
@@ -48,7 +48,7 @@ def main():
         
         # Parse feeds with extended date range to get more jobs
         logger.info("Parsing RSS feeds (looking back 30 days for more results)...")
-        rss_parser = RSSParser(active_feeds)
+        rss_parser = RSSParser(active_feeds, settings=feed_manager.settings)
         jobs = rss_parser.parse_feeds(days_back=30)
         
         # Display detailed job list
@@ -70,8 +70,8 @@ def main():
         # Group by source
         source_counts = {}
         for job in jobs:
-            source = job['source_feed']
-            source_counts[source] = source_counts.get(source, 0) + 1
+            for source in job['source_feeds']:
+                source_counts[source] = source_counts.get(source, 0) + 1
         
         logger.info("")
         logger.info("Jobs by source:")
@@ -0,0 +1,162 @@
+"""
+Seen Entry Store Module
+Remembers which job entries were already seen, extracted and analyzed
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+DEFAULT_DB_FILE = 'job_state.db'
+
+
+def job_key(job: Dict) -> str:
+    """
+    Get the key used to identify a job entry across runs
+
+    Args:
+        job: Job dictionary produced by RSSParser
+
+    Returns:
+        The canonical job link if present, otherwise the feed entry id
+    """
+    return job.get('canonical_link') or job.get('link') or job.get('id', '')
+
+
+class SeenStore:
+    """SQLite-backed record of processed job entries"""
+
+    def __init__(self, db_file: str = DEFAULT_DB_FILE):
+        """
+        Initialize the seen entry store
+
+        Args:
+            db_file: Path to the SQLite database file
+        """
+        self.db_file = db_file
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                title TEXT,
+                link TEXT,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                extracted_at TEXT,
+                analyzed_at TEXT,
+                rejected_at TEXT
+            )
+        """)
+        # Stores created before the pre-filter existed lack the column
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(entries)")}
+        if 'rejected_at' not in columns:
+            self.conn.execute("ALTER TABLE entries ADD COLUMN rejected_at TEXT")
+        self.conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self.conn.close()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Get the stored record for an entry
+
+        Args:
+            key: Entry key (see job_key)
+
+        Returns:
+            Dictionary with the entry's timestamps, or None if never seen
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT key, title, link, first_seen, last_seen, extracted_at, analyzed_at, rejected_at "
+                "FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+        if not row:
+            return None
+
+        columns = ['key', 'title', 'link', 'first_seen', 'last_seen', 'extracted_at', 'analyzed_at', 'rejected_at']
+        return dict(zip(columns, row))
+
+    def filter_unseen(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Record jobs as seen and return those not yet processed
+
+        Args:
+            jobs: Job dictionaries produced by RSSParser
+
+        Returns:
+            Jobs that have not been analyzed or rejected in a previous run, in input order
+        """
+        unseen = [job for job in jobs if self.check_unseen(job)]
+        logger.info(f"Seen store: {len(unseen)} new of {len(jobs)} entries")
+        return unseen
+
+    def check_unseen(self, job: Dict) -> bool:
+        """
+        Record a job as seen and report whether it still needs processing
+
+        An entry counts as processed once it has been analyzed or rejected by
+        the pre-filter; entries that were seen but failed extraction or
+        analysis are reported again.
+
+        Args:
+            job: Job dictionary produced by RSSParser
+
+        Returns:
+            True if the job has not been analyzed or rejected in a previous run
+        """
+        key = job_key(job)
+        if not key:
+            return True
+
+        now = datetime.now().isoformat()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT analyzed_at, rejected_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.conn.execute(
+                    "INSERT INTO entries (key, title, link, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)",
+                    (key, job.get('title'), job.get('link'), now, now)
+                )
+            else:
+                self.conn.execute("UPDATE entries SET last_seen = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+
+        return row is None or (row[0] is None and row[1] is None)
+
+    def mark_extracted(self, key: str) -> None:
+        """Record that an entry's content was extracted"""
+        self._mark(key, 'extracted_at')
+
+    def mark_analyzed(self, key: str) -> None:
+        """Record that an entry was analyzed"""
+        self._mark(key, 'analyzed_at')
+
+    def mark_rejected(self, key: str) -> None:
+        """Record that the pre-filter rejected an entry, so it is not fetched again"""
+        self._mark(key, 'rejected_at')
+
+    def _mark(self, key: str, column: str) -> None:
+        """Set a timestamp column for an entry"""
+        if not key:
+            return
+
+        now = datetime.now().isoformat()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO entries (key, first_seen, last_seen) VALUES (?, ?, ?)",
+                (key, now, now)
+            )
+            self.conn.execute(f"UPDATE entries SET {column} = ? WHERE key = ?", (now, key))
+            self.conn.commit()
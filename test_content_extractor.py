@@ -0,0 +1,49 @@
+"""
+Tests for the lxml text backends
+"""
+
+from pathlib import Path
+
+import lxml.html
+
+from content_extractor import _text_parser, _tree_text, heuristic_to_text, lxml_to_text
+
+PAGES = Path(__file__).parent / 'benchmarks' / 'pages'
+
+
+def tree(html):
+    return lxml.html.fragment_fromstring(html, parser=_text_parser())
+
+
+def test_block_elements_become_lines():
+    assert _tree_text([tree(
+        '<div><h1>Data Engineer</h1><p>Build <b>pipelines</b> in Python.</p>'
+        '<ul><li>SQL</li><li>Airflow</li></ul>Remote</div>'
+    )]) == 'Data Engineer\nBuild pipelines in Python.\nSQL\nAirflow\nRemote'
+
+
+def test_scripts_and_page_chrome_are_skipped():
+    text = _tree_text([tree(
+        '<div><nav>Home | Jobs</nav><script>var x = 1;</script>'
+        '<p>Requirements</p><div class="cookie-banner">Accept</div>After</div>'
+    )])
+    assert text == 'Requirements\nAfter'
+
+
+def test_text_after_comments_is_kept():
+    page = (b'<html><body><p>Intro<!-- wp:paragraph -->continues</p>'
+            b'<!-- wp:list --><ul><li>Python</li></ul><?php echo 1; ?>Tail</body></html>')
+    for to_text in (lxml_to_text, heuristic_to_text):
+        text = to_text(page)[1]
+        assert 'Introcontinues' in text
+        assert 'Tail' in text
+
+
+def test_cms_comment_page_keeps_requirements():
+    page = (PAGES / 'cms_comments_posting.html').read_bytes()
+    text = lxml_to_text(page)[1]
+    assert 'wp:' not in text
+    assert 'Berlin, Germany (hybrid)' in text
+    assert 'and familiarity with Airflow or a similar orchestrator.' in text
+    assert 'or another event streaming system' in text
+    assert 'in production' in text
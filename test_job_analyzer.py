@@ -0,0 +1,49 @@
+"""
+Tests for parsing Gemini analysis responses
+"""
+
+import pytest
+
+pytest.importorskip('google.generativeai')
+
+from job_analyzer import JobAnalyzer
+
+JOB = {'title': 'Data Engineer', 'url': 'https://jobs.example.com/1'}
+
+
+def parse(text):
+    # _parse_response needs no API client or cache
+    return JobAnalyzer.__new__(JobAnalyzer)._parse_response(text, JOB)
+
+
+def test_parses_sections():
+    analysis = parse(
+        "SCORE: 72\n"
+        "MATCHING_POINTS:\n- Python\n- SQL\n"
+        "GAPS:\n- Spark\n"
+        "RECOMMENDATION: Apply.\nStrong overlap."
+    )
+    assert analysis['score'] == 72
+    assert analysis['matching_points'] == ['Python', 'SQL']
+    assert analysis['gaps'] == ['Spark']
+    assert analysis['recommendation'] == 'Apply. Strong overlap.'
+    assert analysis['suitable'] is True
+    assert 'analysis_failed' not in analysis
+
+
+@pytest.mark.parametrize('line, score', [
+    ('SCORE: 85/100', 85),
+    ('SCORE: **40**', 40),
+    ('SCORE: 100 (excellent)', 100),
+])
+def test_score_is_the_first_number(line, score):
+    assert parse(line)['score'] == score
+
+
+@pytest.mark.parametrize('text', ['SCORE: n/a', 'SCORE: 150', 'No score here'])
+def test_invalid_score_gives_flagged_placeholder(text):
+    analysis = parse(text)
+    assert analysis['analysis_failed'] is True
+    assert analysis['score'] == 0
+    assert analysis['suitable'] is False
+    assert analysis['url'] == JOB['url']
@@ -0,0 +1,41 @@
+"""
+Tests for MinHash near-duplicate detection
+"""
+
+from near_duplicate import NearDuplicateDetector
+
+POSTING = ("Senior Python Engineer to build data pipelines with Airflow, Spark and "
+           "PostgreSQL. You will own ingestion services, mentor two engineers and "
+           "work closely with the analytics team on reporting.")
+
+
+def test_signature_similarity_tracks_text_overlap():
+    detector = NearDuplicateDetector()
+    same = detector._similarity(detector.signature(POSTING), detector.signature(POSTING))
+    reposted = detector._similarity(detector.signature(POSTING),
+                                    detector.signature(POSTING + " Apply by Friday."))
+    unrelated = detector._similarity(detector.signature(POSTING),
+                                     detector.signature("Barista wanted for a busy cafe, early "
+                                                        "shifts, latte art and friendly service."))
+    assert same == 1.0
+    assert reposted >= 0.8
+    assert unrelated < 0.2
+
+
+def test_signature_ignores_case_and_markup():
+    detector = NearDuplicateDetector()
+    assert detector.signature(f"<p>{POSTING.upper()}</p>") == detector.signature(POSTING)
+    assert detector.signature('') == []
+
+
+def test_check_flags_reposts_but_not_the_same_key():
+    detector = NearDuplicateDetector()
+    assert detector.check('a', POSTING) is None
+    assert detector.check('a', POSTING) is None
+    assert detector.check('b', POSTING + " Apply by Friday.") == 'a'
+
+
+def test_check_skips_short_texts():
+    detector = NearDuplicateDetector()
+    assert detector.check('a', 'Python Developer') is None
+    assert detector.check('b', 'Python Developer') is None
@@ -0,0 +1,61 @@
+"""
+Tests for BM25 ranking and the local job pre-filter
+"""
+
+from prefilter import BM25, JobPrefilter, tokenize
+from user_config import UserPreferences, UserProfile
+
+
+def make_prefilter(settings=None, **preferences):
+    profile = UserProfile(skills=['Python', 'SQL', 'Airflow', 'React.js'], job_titles=['Data Engineer'])
+    return JobPrefilter(profile, UserPreferences(**preferences), settings)
+
+
+def test_tokenize_keeps_language_names():
+    assert tokenize('C++ and C# (Python)') == ['c++', 'and', 'c#', 'python']
+
+
+def test_bm25_ranks_matching_documents_first():
+    docs = [tokenize(text) for text in (
+        'python sql python airflow pipelines',
+        'sales manager quota travel',
+        'python scripts for reporting',
+    )]
+    bm25 = BM25(docs)
+    query = tokenize('python airflow')
+    scores = [bm25.score(i, query) for i in range(len(docs))]
+    assert scores[0] > scores[2] > scores[1] == 0
+    assert all(score <= bm25.max_score(query) for score in scores)
+
+
+def test_scores_rank_profile_matches_and_zero_unrelated_jobs():
+    prefilter = make_prefilter()
+    jobs = [
+        {'title': 'Barista', 'content': 'Coffee and customer service'},
+        {'title': 'Data Engineer', 'content': 'Python, SQL and Airflow pipelines; React dashboards'},
+        {'title': 'Analyst', 'content': 'Reporting in SQL'},
+    ]
+    scores = prefilter.score_jobs(jobs)
+    assert scores[0] == 0
+    assert scores[1] > scores[2] > 0
+    assert scores[1] <= 100
+
+
+def test_filter_jobs_records_rejections_and_cut_offs():
+    prefilter = make_prefilter({'prefilter_max_jobs': 1}, avoid_keywords=['unpaid'])
+    jobs = [
+        {'url': 'a', 'title': 'Data Engineer', 'content': 'Python and SQL'},
+        {'url': 'b', 'title': 'Data Engineer', 'content': 'Unpaid internship, Python'},
+        {'url': 'c', 'title': 'Data Engineer', 'content': 'Python, SQL and Airflow'},
+        {'url': 'd', 'title': 'Barista', 'content': 'Coffee'},
+    ]
+    passed = prefilter.filter_jobs(jobs)
+    assert [job['url'] for job in passed] == ['c']
+    assert sorted(job['url'] for job in prefilter.rejected) == ['b', 'd']
+    assert prefilter.cut_off == 1
+
+
+def test_required_keywords_match_whole_words():
+    prefilter = make_prefilter(required_keywords=['remote'])
+    assert prefilter.rejection_reason({'title': 'Data Engineer', 'content': 'Fully Remote'}) is None
+    assert prefilter.rejection_reason({'title': 'Data Engineer', 'content': 'remotely managed'})
@@ -0,0 +1,38 @@
+"""
+Tests for the token bucket behind per-host rate limiting
+"""
+
+from rate_limiter import TokenBucket
+
+
+def test_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=2.0, burst=3)
+    now = bucket.updated
+    for _ in range(3):
+        assert bucket.ready_in(now) == 0
+        bucket.take()
+    assert bucket.ready_in(now) == 0.5
+    assert bucket.ready_in(now + 0.5) == 0
+
+
+def test_bucket_refill_is_capped_at_burst():
+    bucket = TokenBucket(rate=1.0, burst=2)
+    now = bucket.updated
+    bucket.take(2)
+    bucket.ready_in(now + 100)
+    assert bucket.tokens == 2
+
+
+def test_bucket_earns_nothing_while_blocked():
+    bucket = TokenBucket(rate=1.0, burst=1)
+    now = bucket.updated
+    bucket.take()
+    bucket.blocked_until = now + 10
+    assert bucket.ready_in(now + 5) == 6
+    assert bucket.ready_in(now + 11) == 0
+
+
+def test_bucket_without_rate_never_refills():
+    bucket = TokenBucket(rate=0, burst=1)
+    bucket.take()
+    assert bucket.ready_in(bucket.updated + 60) == float('inf')
@@ -0,0 +1,31 @@
+"""
+Tests for job link canonicalization
+"""
+
+from url_utils import canonicalize_url, dedup_key, unwrap_redirect
+
+
+def test_canonicalize_strips_tracking_and_normalizes():
+    url = 'HTTPS://Jobs.Example.com:443/careers/123/?utm_source=rss&b=2&gclid=x&a=1#apply'
+    assert canonicalize_url(url) == 'https://jobs.example.com/careers/123?a=1&b=2'
+
+
+def test_canonicalize_keeps_non_default_port_and_root_path():
+    assert canonicalize_url('http://example.com:8080') == 'http://example.com:8080/'
+
+
+def test_canonicalize_unwraps_redirect_wrappers():
+    wrapped = 'https://www.google.com/url?rct=j&url=https://jobs.example.com/1%3Futm_medium%3Demail&ct=ga'
+    assert unwrap_redirect(wrapped) == 'https://jobs.example.com/1?utm_medium=email'
+    assert canonicalize_url(wrapped) == 'https://jobs.example.com/1'
+
+
+def test_canonicalize_leaves_empty_and_relative_input():
+    assert canonicalize_url(None) == ''
+    assert canonicalize_url('') == ''
+    assert canonicalize_url('/jobs/1?utm_source=x') == '/jobs/1?utm_source=x'
+
+
+def test_dedup_key_ignores_scheme_and_www():
+    assert dedup_key('http://www.example.com/jobs/1/') == dedup_key('https://example.com/jobs/1')
+    assert dedup_key('https://example.com/jobs/1') != dedup_key('https://example.com/jobs/2')
@@ -0,0 +1,169 @@
+"""
+URL Utilities Module
+Canonicalizes job links so the same posting can be recognised across feeds
+"""
+
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+
+# Hosts that wrap the real target in a redirect URL, with the wrapper path
+# and the query parameters that may carry the target. A leading dot matches
+# any subdomain.
+REDIRECT_WRAPPERS = {
+    'google.com': ('/url', ('url', 'q')),
+    'www.google.com': ('/url', ('url', 'q')),
+    'l.facebook.com': ('/l.php', ('u',)),
+    'lm.facebook.com': ('/l.php', ('u',)),
+    'www.linkedin.com': ('/redir/redirect', ('url',)),
+    '.safelinks.protection.outlook.com': ('/', ('url',)),
+}
+
+# Link shorteners and wrappers whose target can only be found by following
+# the redirect over the network
+REDIRECT_HOSTS = {
+    't.co', 'bit.ly', 'lnkd.in', 'ow.ly', 'buff.ly', 'tinyurl.com', 'goo.gl',
+    'rebrand.ly', 'shorturl.at', 'click.appcast.io',
+}
+
+# Exact query parameter names that only carry tracking information
+TRACKING_PARAMS = {
+    'gclid', 'dclid', 'fbclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    '_hsenc', '_hsmi', 'ref', 'ref_src', 'referrer', 'source', 'src', 'trk',
+    'trackingid', 'refid', 'gh_src', 'lever-origin', 'lever-source', 'lever-source[]',
+}
+
+# Query parameter prefixes that only carry tracking information
+TRACKING_PREFIXES = ('utm_', 'pk_', 'mtm_', 'hsa_')
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def _redirect_wrapper(host: str) -> Optional[tuple]:
+    """Find the (path, params) entry of REDIRECT_WRAPPERS for a host"""
+    host = host.lower()
+    if host in REDIRECT_WRAPPERS:
+        return REDIRECT_WRAPPERS[host]
+    return next((entry for suffix, entry in REDIRECT_WRAPPERS.items()
+                 if suffix.startswith('.') and host.endswith(suffix)), None)
+
+
+def needs_resolution(url: str) -> bool:
+    """
+    Check whether a URL still points at a redirector after local decoding
+
+    Args:
+        url: URL, typically already passed through unwrap_redirect
+
+    Returns:
+        True for link shorteners and for wrappers whose target could not be
+        decoded, i.e. URLs that have to be followed over the network
+    """
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    wrapper = _redirect_wrapper(host)
+    return host in REDIRECT_HOSTS or (wrapper is not None and parts.path == wrapper[0])
+
+
+def unwrap_redirect(url: str) -> str:
+    """
+    Decode the target of a known redirect wrapper (e.g. google.com/url?url=...)
+
+    Args:
+        url: URL that may be a redirect wrapper
+
+    Returns:
+        The wrapped target URL, or the input unchanged if it is not a wrapper
+    """
+    # Wrappers can be nested; bound the loop in case of a cycle
+    for _ in range(5):
+        parts = urlsplit(url)
+        wrapper = _redirect_wrapper(parts.netloc)
+        if not wrapper or parts.path != wrapper[0]:
+            return url
+        params = wrapper[1]
+
+        query = dict(parse_qsl(parts.query))
+        target = next((query[p] for p in params if query.get(p, '').startswith(('http://', 'https://'))), None)
+        if not target:
+            return url
+        url = target
+
+    return url
+
+
+def _is_tracking_param(name: str) -> bool:
+    """Check whether a query parameter name is a tracking parameter"""
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: Optional[str]) -> str:
+    """
+    Normalize a job link to a canonical form
+
+    Unwraps redirect wrappers, lower-cases scheme and host, drops default
+    ports, fragments, trailing slashes and tracking parameters, and sorts
+    the remaining query parameters.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        Canonical URL (empty string for an empty input)
+    """
+    if not url:
+        return ''
+
+    url = unwrap_redirect(url.strip())
+
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+
+    if not parts.scheme or not parts.netloc:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').rstrip('.')
+    netloc = host
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{port}"
+
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    query = sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name)
+    )
+
+    return urlunsplit((scheme, netloc, path, urlencode(query), ''))
+
+
+def dedup_key(url: Optional[str]) -> str:
+    """
+    Get the key used to detect duplicate links
+
+    Like canonicalize_url, but also ignores the scheme and a leading
+    ``www.`` so http/https and www/non-www variants compare equal.
+
+    Args:
+        url: URL to build a key for
+
+    Returns:
+        Deduplication key
+    """
+    canonical = canonicalize_url(url)
+    parts = urlsplit(canonical)
+    if not parts.netloc:
+        return canonical
+
+    host = parts.netloc[4:] if parts.netloc.startswith('www.') else parts.netloc
+    return urlunsplit(('', host, parts.path, parts.query, '')).lstrip('/')